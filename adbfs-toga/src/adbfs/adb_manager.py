@@ -3,6 +3,7 @@ ADB 명령어 래퍼 클래스
 Android Debug Bridge를 통한 디바이스 관리 및 파일 시스템 접근
 """
 
+import asyncio
 import subprocess
 import threading
 import time
@@ -12,6 +13,106 @@ import os
 import shutil
 import sys
 
+_LS_PATTERNS = [
+    # With group, YYYY-MM-DD HH:MM
+    re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
+    # With group, Mmm DD HH:MM
+    re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\w{3}\s+\d{1,2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
+    # With group, Mmm DD YYYY
+    re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\w{3}\s+\d{1,2}\s+\d{4})\s+(?P<name>.+)$'),
+    # Without group, YYYY-MM-DD HH:MM
+    re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<size>\S+)\s+(?P<date>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
+]
+
+# `stat -c` 출력 형식: '/'는 앞의 다섯 필드에 나올 수 없으므로 마지막 경로 필드와 구분 가능
+_STAT_FORMAT = '%A/%s/%Y/%U/%G/%n'
+
+
+class ADBShellSession:
+    """하나의 `adb shell` 프로세스를 유지하며 명령어를 순차적으로 실행하는 클래스
+
+    명령어마다 adb 프로세스를 새로 띄우는 대신 표준입력으로 명령어를 보내고,
+    종료 코드가 담긴 구분자 줄이 나올 때까지 표준출력을 읽는다.
+    """
+
+    SENTINEL = '__ADBFS_END__'
+
+    def __init__(self, adb_path: str, device_id: str):
+        self.adb_path = adb_path
+        self.device_id = device_id
+        self._process = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'ADBShellSession':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def open(self):
+        """셸 프로세스 시작"""
+        self._process = await asyncio.create_subprocess_exec(
+            self.adb_path, '-s', self.device_id, 'shell',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+    async def close(self):
+        """셸 프로세스 종료"""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except (asyncio.TimeoutError, ConnectionError):
+            process.kill()
+            await process.wait()
+
+    async def run(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        """명령어를 실행하고 (종료 코드, 표준출력)을 반환"""
+        async with self._lock:
+            if not self.is_open:
+                raise ConnectionError("adb shell session is not open")
+            # The leading newline guarantees the sentinel starts on its own line.
+            line = f"{command}; printf '\\n{self.SENTINEL}:%d\\n' $?\n"
+            try:
+                self._process.stdin.write(line.encode('utf-8'))
+                await self._process.stdin.drain()
+                return await asyncio.wait_for(self._read_until_sentinel(), timeout)
+            except BaseException:
+                # The stream is out of sync once a command fails or is cancelled mid-way; drop the session.
+                await self._abort()
+                raise
+
+    async def _abort(self):
+        """실행 중인 명령어를 기다리지 않고 셸 프로세스 강제 종료"""
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    async def _read_until_sentinel(self) -> Tuple[int, str]:
+        lines = []
+        marker = f"{self.SENTINEL}:"
+        while True:
+            raw = await self._process.stdout.readline()
+            if not raw:
+                raise ConnectionError("adb shell session closed")
+            text = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+            if text.startswith(marker):
+                if lines and lines[-1] == '':
+                    lines.pop()
+                return int(text[len(marker):] or -1), '\n'.join(lines)
+            lines.append(text)
+
+
 class ADBManager:
     """ADB 명령어를 실행하고 디바이스와 상호작용하는 클래스"""
     
@@ -98,6 +199,46 @@ class ADBManager:
             return True
         return False
     
+    def open_shell_session(self) -> Optional['ADBShellSession']:
+        """현재 디바이스에 대한 지속형 셸 세션 객체를 생성 (열기는 호출자가 담당)"""
+        if not self.current_device or not self.adb_path:
+            return None
+        return ADBShellSession(self.adb_path, self.current_device)
+
+    def popen(self, args: List[str], **kwargs) -> Optional[subprocess.Popen]:
+        """현재 디바이스를 대상으로 `adb <args>` 프로세스를 시작 (입출력 스트림 처리는 호출자가 담당)"""
+        if not self.current_device or not self.adb_path:
+            return None
+        return subprocess.Popen([self.adb_path, '-s', self.current_device, *args], **kwargs)
+
+    def shell(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        """단발성 `adb shell` 명령어 실행 후 (종료 코드, 표준출력)을 반환"""
+        if not self.current_device or not self.adb_path:
+            return -1, ""
+        try:
+            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', command],
+                                  capture_output=True, text=True, timeout=timeout)
+            return result.returncode, result.stdout
+        except subprocess.TimeoutExpired:
+            print(f"⏰ ADB 명령어 타임아웃: {command}")
+            return -1, ""
+        except Exception as e:
+            print(f"❌ ADB 셸 명령어 실패: {e}")
+            return -1, ""
+
+    def file_list_command(self, path: str) -> str:
+        """파일 목록 조회에 사용할 셸 명령어
+
+        `stat` 출력(권한/크기/mtime/소유자/그룹/경로)을 우선 사용하고,
+        `find`나 `stat -c`가 없는 디바이스에서는 `ls -la`로 대체한다.
+        `find`가 일부 항목을 출력한 뒤 실패하면 (목록을 읽는 사이 항목이 사라진 경우 등)
+        같은 항목이 두 형식으로 중복되지 않도록 `stat` 출력이 하나도 없을 때만 대체한다.
+        """
+        return (f"__adbfs_ls=$(find -H {path} -mindepth 1 -maxdepth 1 -exec stat -c '{_STAT_FORMAT}' {{}} + 2>/dev/null);"
+                f" __adbfs_status=$?;"
+                f" if [ -n \"$__adbfs_ls\" ]; then printf '%s\\n' \"$__adbfs_ls\";"
+                f" elif [ $__adbfs_status -ne 0 ]; then ls -la {path}; fi")
+
     def get_file_list(self, path: str = "/") -> List[Dict[str, str]]:
         """지정된 경로의 파일 목록을 가져옴"""
         if not self.current_device or not self.adb_path:
@@ -105,67 +246,16 @@ class ADBManager:
             return []
         
         try:
-            print(f"🔍 ADB 명령어 실행: adb -s {self.current_device} shell ls -la {path}")
-            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'ls', '-la', path],
+            command = self.file_list_command(path)
+            print(f"🔍 ADB 명령어 실행: adb -s {self.current_device} shell {command}")
+            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', command],
                                   capture_output=True, text=True, timeout=10)
             
             if result.returncode != 0:
                 print(f"❌ ADB 명령어 실패: {result.stderr}")
                 return []
             
-            files = []
-            lines = result.stdout.strip().split('\n')
-
-            patterns = [
-                # With group, YYYY-MM-DD HH:MM
-                re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
-                # With group, Mmm DD HH:MM
-                re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\w{3}\s+\d{1,2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
-                # With group, Mmm DD YYYY
-                re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<group>\S+)\s+(?P<size>\S+)\s+(?P<date>\w{3}\s+\d{1,2}\s+\d{4})\s+(?P<name>.+)$'),
-                # Without group, YYYY-MM-DD HH:MM
-                re.compile(r'^(?P<permissions>\S+)\s+(?P<links>\d+)\s+(?P<owner>\S+)\s+(?P<size>\S+)\s+(?P<date>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+(?P<name>.+)$'),
-            ]
-            
-            for i, line in enumerate(lines):
-                if line.strip() and not line.startswith('total'):
-                    match = None
-                    for pattern in patterns:
-                        match = pattern.match(line)
-                        if match:
-                            break
-                    
-                    if match:
-                        data = match.groupdict()
-                        permissions = data['permissions']
-                        name_part = data['name']
-                        
-                        if ' -> ' in name_part:
-                            name = name_part.split(' -> ')[0].strip()
-                        else:
-                            name = name_part.strip()
-                        
-                        if name in ['.', '..']:
-                            continue
-                        
-                        is_directory = permissions.startswith('d')
-                        is_link = permissions.startswith('l')
-                        
-                        files.append({
-                            'name': name,
-                            'path': os.path.join(path, name).replace('//', '/'),
-                            'is_directory': is_directory,
-                            'is_link': is_link,
-                            'size': data['size'],
-                            'permissions': permissions,
-                            'date': data['date'],
-                            'owner': data['owner'],
-                            'group': data.get('group', '')
-                        })
-                    else:
-                        print(f"⚠️ 파싱 실패: {line}")
-            
-            return files
+            return self.parse_file_list(result.stdout, path)
             
         except subprocess.TimeoutExpired:
             print("⏰ ADB 명령어 타임아웃")
@@ -173,21 +263,106 @@ class ADBManager:
         except Exception as e:
             print(f"❌ 파일 목록 가져오기 실패: {e}")
             return []
+
+    def parse_file_list(self, output: str, path: str) -> List[Dict[str, str]]:
+        """`file_list_command` 출력(`stat` 또는 `ls -la` 형식)을 파싱하여 파일 목록으로 변환
+
+        `stat` 형식 항목은 숫자 `mtime`을, `ls -la` 형식 항목은 문자열 `date`를 가진다.
+        """
+        files = []
+        lines = output.strip().split('\n')
+
+        for line in lines:
+            line = line.rstrip('\r')
+            fields = line.split('/', 5)
+            if len(fields) == 6 and fields[1].isdigit() and fields[2].isdigit():
+                permissions, size, mtime, owner, group, full_path = fields
+                name = full_path.rpartition('/')[2]
+                files.append({
+                    'name': name,
+                    'path': full_path,
+                    'is_directory': permissions.startswith('d'),
+                    'is_link': permissions.startswith('l'),
+                    'size': size,
+                    'permissions': permissions,
+                    'date': '',
+                    'mtime': int(mtime),
+                    'owner': owner,
+                    'group': group
+                })
+                continue
+
+            if line.strip() and not line.startswith('total'):
+                match = None
+                for pattern in _LS_PATTERNS:
+                    match = pattern.match(line)
+                    if match:
+                        break
+                
+                if match:
+                    data = match.groupdict()
+                    permissions = data['permissions']
+                    name_part = data['name']
+                    
+                    if ' -> ' in name_part:
+                        name = name_part.split(' -> ')[0].strip()
+                    else:
+                        name = name_part.strip()
+                    
+                    if name in ['.', '..']:
+                        continue
+                    
+                    is_directory = permissions.startswith('d')
+                    is_link = permissions.startswith('l')
+                    
+                    files.append({
+                        'name': name,
+                        'path': os.path.join(path, name).replace('//', '/'),
+                        'is_directory': is_directory,
+                        'is_link': is_link,
+                        'size': data['size'],
+                        'permissions': permissions,
+                        'date': data['date'],
+                        'mtime': None,
+                        'owner': data['owner'],
+                        'group': data.get('group', '')
+                    })
+                else:
+                    print(f"⚠️ 파싱 실패: {line}")
+        
+        return files
     
+    def stat_size(self, remote_path: str) -> Optional[int]:
+        """원격 파일 크기 조회 (실패 시 None)"""
+        if not self.current_device or not self.adb_path:
+            return None
+        try:
+            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'stat', '-c', '%s', remote_path],
+                                  capture_output=True, text=True, timeout=5)
+            if result.returncode != 0:
+                return None
+            return int(result.stdout.strip())
+        except (subprocess.TimeoutExpired, ValueError):
+            return None
+
     def pull_file(self, remote_path: str, local_path: str, 
-                  progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
-        """디바이스에서 로컬로 파일을 다운로드"""
+                  progress_callback: Optional[Callable[..., None]] = None,
+                  label: Optional[str] = None,
+                  total_size: Optional[int] = None) -> bool:
+        """디바이스에서 로컬로 파일을 다운로드
+
+        `label`을 주면 진행률 콜백이 (전송량, 전체, label) 세 인자로 호출된다.
+        `total_size`를 이미 알고 있으면 넘겨서 크기 조회를 생략할 수 있다 (모르면 -1).
+        """
         if not self.current_device or not self.adb_path:
             return False
+        extra = () if label is None else (label,)
         
         try:
             # Get file size first
-            size_result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'stat', '-c', '%s', remote_path],
-                                      capture_output=True, text=True, timeout=5)
-            if size_result.returncode != 0:
-                total_size = -1
-            else:
-                total_size = int(size_result.stdout.strip())
+            if total_size is None:
+                size = self.stat_size(remote_path)
+                total_size = -1 if size is None else size
 
             # Use Popen to capture output in real-time
             process = subprocess.Popen(
@@ -206,9 +381,9 @@ class ADBManager:
                         percentage = int(match.group(1))
                         if total_size > 0:
                             transferred = int(total_size * percentage / 100)
-                            progress_callback(transferred, total_size)
+                            progress_callback(transferred, total_size, *extra)
                         else:
-                            progress_callback(percentage, 100)
+                            progress_callback(percentage, 100, *extra)
 
             return_code = process.wait()
             if return_code != 0:
@@ -217,18 +392,45 @@ class ADBManager:
                 return False
 
             if progress_callback and total_size > 0:
-                progress_callback(total_size, total_size)
+                progress_callback(total_size, total_size, *extra)
             return True
                 
         except Exception as e:
             print(f"파일 다운로드 실패: {e}")
             return False
     
+    def pull_file_simple(self, remote_path: str, local_path: str) -> bool:
+        """진행률 추적 없이 `adb pull` 한 번으로 다운로드 (작은 파일용)"""
+        return self._run_transfer('pull', remote_path, local_path)
+
+    def push_file_simple(self, local_path: str, remote_path: str) -> bool:
+        """진행률 추적 없이 `adb push` 한 번으로 업로드 (작은 파일용)"""
+        return self._run_transfer('push', local_path, remote_path)
+
+    def _run_transfer(self, command: str, src_path: str, dst_path: str) -> bool:
+        if not self.current_device or not self.adb_path:
+            return False
+        try:
+            result = subprocess.run([self.adb_path, '-s', self.current_device, command, src_path, dst_path],
+                                  capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"파일 전송 실패 ({command}): {result.stderr}")
+                return False
+            return True
+        except Exception as e:
+            print(f"파일 전송 실패 ({command}): {e}")
+            return False
+
     def push_file(self, local_path: str, remote_path: str,
-                  progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
-        """로컬에서 디바이스로 파일을 업로드"""
+                  progress_callback: Optional[Callable[..., None]] = None,
+                  label: Optional[str] = None) -> bool:
+        """로컬에서 디바이스로 파일을 업로드
+
+        `label`을 주면 진행률 콜백이 (전송량, 전체, label) 세 인자로 호출된다.
+        """
         if not self.current_device or not self.adb_path:
             return False
+        extra = () if label is None else (label,)
         
         try:
             if not os.path.exists(local_path):
@@ -251,7 +453,7 @@ class ADBManager:
                     if match:
                         percentage = int(match.group(1))
                         transferred = int(local_size * percentage / 100)
-                        progress_callback(transferred, local_size)
+                        progress_callback(transferred, local_size, *extra)
 
             return_code = process.wait()
             if return_code != 0:
@@ -260,7 +462,7 @@ class ADBManager:
                 return False
 
             if progress_callback:
-                progress_callback(local_size, local_size)
+                progress_callback(local_size, local_size, *extra)
             return True
                 
         except Exception as e:
@@ -286,13 +488,27 @@ class ADBManager:
             return False
         
         try:
-            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'mv', old_path, new_path],
+            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'mv', '-f', old_path, new_path],
                                   capture_output=True, text=True, timeout=10)
             return result.returncode == 0
         except Exception as e:
             print(f"파일 이름변경 실패: {e}")
             return False
     
+    def copy_file(self, src_path: str, dest_path: str) -> bool:
+        """디바이스 내부에서 파일/디렉토리를 복사 (데이터가 디바이스 밖으로 나가지 않음)"""
+        if not self.current_device or not self.adb_path:
+            return False
+        
+        try:
+            # 큰 파일/디렉토리 복사는 오래 걸릴 수 있으므로 타임아웃을 두지 않음
+            result = subprocess.run([self.adb_path, '-s', self.current_device, 'shell', 'cp', '-a', src_path, dest_path],
+                                  capture_output=True, text=True)
+            return result.returncode == 0
+        except Exception as e:
+            print(f"파일 복사 실패: {e}")
+            return False
+    
     def get_link_target(self, link_path: str) -> Optional[str]:
         """심볼릭 링크의 타겟 경로를 가져옴"""
         if not self.current_device or not self.adb_path:
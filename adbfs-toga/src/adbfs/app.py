@@ -2,15 +2,65 @@ import toga
 from toga.style import Pack
 from toga.style.pack import COLUMN, ROW, LEFT, RIGHT, BOLD, CENTER, MONOSPACE, TRANSPARENT
 import os
+import posixpath
+import asyncio
+import concurrent.futures
 import datetime
+import time
 import platform
 import subprocess
 import shutil
-from contextlib import asynccontextmanager
+import shlex
+import tempfile
+from collections import OrderedDict
+from itertools import islice
+from contextlib import asynccontextmanager, nullcontext
 
 from .adb_manager import ADBManager
 from .file_manager import FileManager
-from .utils import get_human_readable_size, get_file_type_icon
+from .utils import get_human_readable_size, get_file_type_icon, short_name_list, split_paste_sources, SORT_KEYS
+
+PROGRESS_UPDATE_INTERVAL = 1 / 30 # seconds between progress bar updates
+REMOTE_LISTING_CACHE_SIZE = 32 # directories kept in the remote listing cache
+ISDIR_CACHE_SIZE = 4096 # (device, path) -> is-directory results kept
+IO_WORKERS = 32 # threads for interactive adb calls (ls, stat, mv, rm, ...)
+TRANSFER_WORKERS = 4 # threads for concurrent adb push/pull transfers
+
+# Shared style descriptors. Widgets copy their style on construction, so these
+# can be reused across widgets instead of building a new Pack for each one.
+_FLEX = Pack(flex=1)
+_ROW = Pack(direction=ROW)
+_TOOLBAR_ROW = Pack(direction=ROW, alignment=CENTER, padding_top=5)
+_BUTTON_ROW = Pack(direction=ROW, padding_top=5)
+_DIALOG_BOX = Pack(direction=COLUMN, padding=20)
+_DIALOG_BUTTON_ROW = Pack(direction=ROW, padding_top=20)
+_FIELD_LABEL = Pack(padding_right=10)
+_TRAILING_BUTTON = Pack(padding_left=10)
+_ACTION_BUTTON = Pack(flex=1, padding=5)
+_PANEL_TITLE = Pack(font_weight=BOLD, text_align=CENTER)
+
+def open_with_default_app(path):
+    """Open a local file with the platform's default application (blocking)."""
+    if platform.system() == 'Darwin':
+        subprocess.run(['open', path])
+    elif platform.system() == 'Windows':
+        os.startfile(path)
+    else:
+        subprocess.run(['xdg-open', path])
+
+def _rjoin(*parts):
+    """Join device paths, which are always '/'-separated regardless of the host OS."""
+    return posixpath.join(*parts)
+
+def delete_local_path(path, is_directory):
+    """Delete a local file or directory tree (blocking). Already-missing paths count as deleted."""
+    try:
+        if is_directory:
+            shutil.rmtree(path)
+        else:
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 @asynccontextmanager
 async def busy_cursor(window):
@@ -21,6 +71,16 @@ async def busy_cursor(window):
         window.cursor = toga.constants.NORMAL # Using toga.constants.NORMAL for default
 
 class adbfs(toga.App):
+    @property
+    def current_remote_path(self):
+        return self._current_remote_path
+
+    @current_remote_path.setter
+    def current_remote_path(self, value):
+        # Keep a shell-quoted copy around so refreshes don't rebuild it on every call.
+        self._current_remote_path = value
+        self._current_remote_path_quoted = shlex.quote(value)
+
     async def _get_text_input(self, title, message, initial_value=""):
         future = self.loop.create_future()
         dialog = toga.Window(title=title, closable=False)
@@ -33,14 +93,14 @@ class adbfs(toga.App):
             future.set_result(None)
             dialog.close()
 
-        box = toga.Box(style=Pack(direction=COLUMN, padding=20))
+        box = toga.Box(style=_DIALOG_BOX)
         box.add(toga.Label(message, style=Pack(padding_bottom=10)))
-        text_input = toga.TextInput(value=initial_value, style=Pack(flex=1), on_confirm=on_ok)
+        text_input = toga.TextInput(value=initial_value, style=_FLEX, on_confirm=on_ok)
         box.add(text_input)
 
-        button_box = toga.Box(style=Pack(direction=ROW, padding_top=20))
-        button_box.add(toga.Button("Cancel", on_press=on_cancel, style=Pack(flex=1)))
-        button_box.add(toga.Button("OK", on_press=on_ok, style=Pack(flex=1)))
+        button_box = toga.Box(style=_DIALOG_BUTTON_ROW)
+        button_box.add(toga.Button("Cancel", on_press=on_cancel, style=_FLEX))
+        button_box.add(toga.Button("OK", on_press=on_ok, style=_FLEX))
         box.add(button_box)
         
         # Add key handler for Escape
@@ -69,18 +129,18 @@ class adbfs(toga.App):
             future.set_result((None, None))
             dialog.close()
 
-        ip_input = toga.TextInput(placeholder="IP Address:Port", style=Pack(flex=1), on_confirm=on_ok)
-        pairing_code_input = toga.TextInput(placeholder="Pairing Code", style=Pack(flex=1), on_confirm=on_ok)
+        ip_input = toga.TextInput(placeholder="IP Address:Port", style=_FLEX, on_confirm=on_ok)
+        pairing_code_input = toga.TextInput(placeholder="Pairing Code", style=_FLEX, on_confirm=on_ok)
 
-        box = toga.Box(style=Pack(direction=COLUMN, padding=20))
+        box = toga.Box(style=_DIALOG_BOX)
         box.add(toga.Label("Enter device IP address and pairing code:", style=Pack(padding_bottom=10)))
         box.add(ip_input)
         box.add(toga.Label("Pairing Code:", style=Pack(padding_top=10, padding_bottom=10)))
         box.add(pairing_code_input)
 
-        button_box = toga.Box(style=Pack(direction=ROW, padding_top=20))
-        button_box.add(toga.Button("Cancel", on_press=on_cancel, style=Pack(flex=1)))
-        button_box.add(toga.Button("OK", on_press=on_ok, style=Pack(flex=1)))
+        button_box = toga.Box(style=_DIALOG_BUTTON_ROW)
+        button_box.add(toga.Button("Cancel", on_press=on_cancel, style=_FLEX))
+        button_box.add(toga.Button("OK", on_press=on_ok, style=_FLEX))
         box.add(button_box)
 
         # Add key handler for Escape
@@ -99,10 +159,19 @@ class adbfs(toga.App):
 
     def startup(self):
         """Construct and show the Toga application."""
+        # ADB calls are I/O bound and mostly wait on the device; give them their own
+        # pool instead of Python's default executor, which is sized for CPU work.
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix='adbfs-io')
+        self.loop.set_default_executor(self._io_executor)
+        # Bulk pulls/pushes get a separate pool so a long transfer never holds up
+        # interactive calls like ls or getprop.
+        self._transfer_executor = concurrent.futures.ThreadPoolExecutor(max_workers=TRANSFER_WORKERS, thread_name_prefix='adbfs-xfer')
+
         self.adb_manager = ADBManager()
         self.file_manager = FileManager(self.adb_manager)
 
         self.current_device = None
+        self._shell = None
         self.current_remote_path = "/"
         self.current_local_path = os.path.join(os.path.expanduser('~'), "Downloads")
 
@@ -114,6 +183,13 @@ class adbfs(toga.App):
 
         self.local_raw_data = [] # Initialize
         self.remote_raw_data = [] # Initialize
+        self.local_sorted_view = [] # Rows currently shown, in display order
+        self.remote_sorted_view = []
+        self._remote_listing_cache = OrderedDict() # remote path -> table rows
+        self._remote_listing_generation = 0 # Bumped on invalidation; older in-flight listings are not cached
+        self._isdir_cache = OrderedDict() # (device, remote path) -> bool
+        self._device_has_cp = None # Whether the current device has `cp`; probed on first paste
+        self._background_tasks = set()
 
         # Create commands for context menus
         local_context_menu_group = toga.Group(None)
@@ -162,11 +238,11 @@ class adbfs(toga.App):
         
         # Device selection
         device_box = toga.Box(style=Pack(direction=ROW, alignment=CENTER))
-        device_box.add(toga.Label("Device:", style=Pack(padding_right=10)))
-        self.device_selection = toga.Selection(style=Pack(flex=1))
+        device_box.add(toga.Label("Device:", style=_FIELD_LABEL))
+        self.device_selection = toga.Selection(style=_FLEX)
         self.device_selection.on_select = self.on_device_selected
         device_box.add(self.device_selection)
-        refresh_button = toga.Button("Refresh", on_press=self.refresh_devices, style=Pack(padding_left=10))
+        refresh_button = toga.Button("Refresh", on_press=self.refresh_devices, style=_TRAILING_BUTTON)
         device_box.add(refresh_button)
 
         self.adb_actions_button = toga.Button(
@@ -177,18 +253,18 @@ class adbfs(toga.App):
         device_box.add(self.adb_actions_button)
         
         # Paths
-        local_path_box = toga.Box(style=Pack(direction=ROW, alignment=CENTER, padding_top=5))
-        local_path_box.add(toga.Label("Local Path:", style=Pack(padding_right=10)))
-        self.local_path_input = toga.TextInput(value=self.current_local_path, style=Pack(flex=1))
+        local_path_box = toga.Box(style=_TOOLBAR_ROW)
+        local_path_box.add(toga.Label("Local Path:", style=_FIELD_LABEL))
+        self.local_path_input = toga.TextInput(value=self.current_local_path, style=_FLEX)
         local_path_box.add(self.local_path_input)
-        browse_button = toga.Button("Browse", on_press=self.browse_local_path, style=Pack(padding_left=10))
+        browse_button = toga.Button("Browse", on_press=self.browse_local_path, style=_TRAILING_BUTTON)
         local_path_box.add(browse_button)
 
-        remote_path_box = toga.Box(style=Pack(direction=ROW, alignment=CENTER, padding_top=5))
-        remote_path_box.add(toga.Label("Remote Path:", style=Pack(padding_right=10)))
-        self.remote_path_input = toga.TextInput(value=self.current_remote_path, style=Pack(flex=1))
+        remote_path_box = toga.Box(style=_TOOLBAR_ROW)
+        remote_path_box.add(toga.Label("Remote Path:", style=_FIELD_LABEL))
+        self.remote_path_input = toga.TextInput(value=self.current_remote_path, style=_FLEX)
         remote_path_box.add(self.remote_path_input)
-        go_button = toga.Button("Go", on_press=self.navigate_remote_path, style=Pack(padding_left=10))
+        go_button = toga.Button("Go", on_press=self.navigate_remote_path, style=_TRAILING_BUTTON)
         remote_path_box.add(go_button)
 
         control_box.add(device_box)
@@ -200,41 +276,41 @@ class adbfs(toga.App):
         
         # Local files
         local_panel = toga.Box(style=Pack(direction=COLUMN, flex=1, padding_right=5))
-        local_panel.add(toga.Label("Local Files", style=Pack(font_weight=BOLD, text_align=CENTER)))
+        local_panel.add(toga.Label("Local Files", style=_PANEL_TITLE))
         
-        local_sort_toolbox = toga.Box(style=Pack(direction=ROW, alignment=CENTER, padding_top=5))
-        local_sort_toolbox.add(toga.Label("정렬 기준:", style=Pack(padding_right=10)))
-        local_sort_buttons = toga.Box(style=Pack(direction=ROW))
-        local_sort_buttons.add(toga.Button("Name", on_press=lambda w: self.sort_local_table('name'), style=Pack(flex=1)))
-        local_sort_buttons.add(toga.Button("Type", on_press=lambda w: self.sort_local_table('type'), style=Pack(flex=1)))
-        local_sort_buttons.add(toga.Button("Size", on_press=lambda w: self.sort_local_table('size'), style=Pack(flex=1)))
-        local_sort_buttons.add(toga.Button("Date", on_press=lambda w: self.sort_local_table('date'), style=Pack(flex=1)))
+        local_sort_toolbox = toga.Box(style=_TOOLBAR_ROW)
+        local_sort_toolbox.add(toga.Label("정렬 기준:", style=_FIELD_LABEL))
+        local_sort_buttons = toga.Box(style=_ROW)
+        local_sort_buttons.add(toga.Button("Name", on_press=lambda w: self.sort_local_table('name'), style=_FLEX))
+        local_sort_buttons.add(toga.Button("Type", on_press=lambda w: self.sort_local_table('type'), style=_FLEX))
+        local_sort_buttons.add(toga.Button("Size", on_press=lambda w: self.sort_local_table('size'), style=_FLEX))
+        local_sort_buttons.add(toga.Button("Date", on_press=lambda w: self.sort_local_table('date'), style=_FLEX))
         local_sort_toolbox.add(local_sort_buttons)
         local_panel.add(local_sort_toolbox)
 
-        self.local_file_table = toga.Table(headings=["Name", "Type", "Size", "Date"], on_activate=self.on_local_file_activate, style=Pack(flex=1), multiple_select=True)
+        self.local_file_table = toga.Table(headings=["Name", "Type", "Size", "Date"], on_activate=self.on_local_file_activate, style=_FLEX, multiple_select=True)
         self.local_file_table.context_menu = local_context_menu_group
         local_panel.add(self.local_file_table)
 
-        local_buttons = toga.Box(style=Pack(direction=ROW, padding_top=5))
-        local_buttons.add(toga.Button("Refresh", on_press=self.refresh_local_file_list, style=Pack(flex=1)))
-        local_buttons.add(toga.Button("New Folder", on_press=self.create_local_directory, style=Pack(flex=1)))
-        local_buttons.add(toga.Button("Delete", on_press=self.delete_selected_local_file, style=Pack(flex=1)))
-        local_buttons.add(toga.Button("Rename", on_press=self.rename_selected_local_file, style=Pack(flex=1)))
-        local_buttons.add(toga.Button("Upload", on_press=self.upload_selected_local_file, style=Pack(flex=1)))
+        local_buttons = toga.Box(style=_BUTTON_ROW)
+        local_buttons.add(toga.Button("Refresh", on_press=self.refresh_local_file_list, style=_FLEX))
+        local_buttons.add(toga.Button("New Folder", on_press=self.create_local_directory, style=_FLEX))
+        local_buttons.add(toga.Button("Delete", on_press=self.delete_selected_local_file, style=_FLEX))
+        local_buttons.add(toga.Button("Rename", on_press=self.rename_selected_local_file, style=_FLEX))
+        local_buttons.add(toga.Button("Upload", on_press=self.upload_selected_local_file, style=_FLEX))
         local_panel.add(local_buttons)
 
         # Remote files
         remote_panel = toga.Box(style=Pack(direction=COLUMN, flex=1, padding_left=5))
-        remote_panel.add(toga.Label("Remote Files", style=Pack(font_weight=BOLD, text_align=CENTER)))
-
-        remote_sort_toolbox = toga.Box(style=Pack(direction=ROW, alignment=CENTER, padding_top=5))
-        remote_sort_toolbox.add(toga.Label("정렬 기준:", style=Pack(padding_right=10)))
-        remote_sort_buttons = toga.Box(style=Pack(direction=ROW))
-        remote_sort_buttons.add(toga.Button("Name", on_press=lambda w: self.sort_remote_table('name'), style=Pack(flex=1)))
-        remote_sort_buttons.add(toga.Button("Type", on_press=lambda w: self.sort_remote_table('type'), style=Pack(flex=1)))
-        remote_sort_buttons.add(toga.Button("Size", on_press=lambda w: self.sort_remote_table('size'), style=Pack(flex=1)))
-        remote_sort_buttons.add(toga.Button("Date", on_press=lambda w: self.sort_remote_table('date'), style=Pack(flex=1)))
+        remote_panel.add(toga.Label("Remote Files", style=_PANEL_TITLE))
+
+        remote_sort_toolbox = toga.Box(style=_TOOLBAR_ROW)
+        remote_sort_toolbox.add(toga.Label("정렬 기준:", style=_FIELD_LABEL))
+        remote_sort_buttons = toga.Box(style=_ROW)
+        remote_sort_buttons.add(toga.Button("Name", on_press=lambda w: self.sort_remote_table('name'), style=_FLEX))
+        remote_sort_buttons.add(toga.Button("Type", on_press=lambda w: self.sort_remote_table('type'), style=_FLEX))
+        remote_sort_buttons.add(toga.Button("Size", on_press=lambda w: self.sort_remote_table('size'), style=_FLEX))
+        remote_sort_buttons.add(toga.Button("Date", on_press=lambda w: self.sort_remote_table('date'), style=_FLEX))
         remote_sort_toolbox.add(remote_sort_buttons)
         remote_panel.add(remote_sort_toolbox)
 
@@ -242,18 +318,18 @@ class adbfs(toga.App):
             headings=["Name", "Type", "Size", "Date"],
             on_activate=self.on_remote_file_activate,
             on_select=self.on_remote_file_select,
-            style=Pack(flex=1),
+            style=_FLEX,
             multiple_select=True
         )
         self.remote_file_table.context_menu = remote_context_menu_group
         remote_panel.add(self.remote_file_table)
 
-        remote_buttons = toga.Box(style=Pack(direction=ROW, padding_top=5))
-        remote_buttons.add(toga.Button("Refresh", on_press=self.refresh_remote_file_list, style=Pack(flex=1)))
-        remote_buttons.add(toga.Button("New Folder", on_press=self.create_remote_directory, style=Pack(flex=1)))
-        remote_buttons.add(toga.Button("Delete", on_press=self.delete_selected_remote_file, style=Pack(flex=1)))
-        remote_buttons.add(toga.Button("Rename", on_press=self.rename_selected_remote_file, style=Pack(flex=1)))
-        remote_buttons.add(toga.Button("Download", on_press=self.download_selected_remote_file, style=Pack(flex=1)))
+        remote_buttons = toga.Box(style=_BUTTON_ROW)
+        remote_buttons.add(toga.Button("Refresh", on_press=self.refresh_remote_file_list, style=_FLEX))
+        remote_buttons.add(toga.Button("New Folder", on_press=self.create_remote_directory, style=_FLEX))
+        remote_buttons.add(toga.Button("Delete", on_press=self.delete_selected_remote_file, style=_FLEX))
+        remote_buttons.add(toga.Button("Rename", on_press=self.rename_selected_remote_file, style=_FLEX))
+        remote_buttons.add(toga.Button("Download", on_press=self.download_selected_remote_file, style=_FLEX))
         remote_panel.add(remote_buttons)
 
         explorer_box.add(local_panel)
@@ -280,17 +356,51 @@ class adbfs(toga.App):
         self.main_window.content = main_box
         self.main_window.show()
 
+        self._build_adb_actions_window()
+
         self.add_background_task(self.refresh_devices)
         self.add_background_task(self.refresh_local_file_list)
 
+    def on_exit(self):
+        self.file_manager.shutdown()
+        self._transfer_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        return True
+
     def log_message(self, message):
         self.log_view.value += message + '\n'
         self.log_view.scroll_to_bottom()
 
+    async def _open_shell_session(self):
+        await self._close_shell_session()
+        session = self.adb_manager.open_shell_session()
+        if session is None:
+            return
+        try:
+            await session.open()
+            self._shell = session
+        except OSError as e:
+            self.log_message(f"Could not open persistent adb shell, using one-shot commands: {e}")
+
+    async def _close_shell_session(self):
+        session, self._shell = self._shell, None
+        if session is not None:
+            await session.close()
+
+    async def _run_remote(self, command):
+        """Run a shell command on the current device, returning (exit status, stdout)."""
+        if self._shell is not None and self._shell.is_open:
+            try:
+                return await self._shell.run(command)
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                self.log_message(f"adb shell session lost, falling back to one-shot commands: {e!r}")
+                await self._close_shell_session()
+        return await asyncio.to_thread(self.adb_manager.shell, command)
+
     async def refresh_devices(self, widget=None):
         async with busy_cursor(self.main_window):
             self.log_message("Refreshing devices...")
-            devices = await self.loop.run_in_executor(None, self.adb_manager.get_connected_devices)
+            devices = await asyncio.to_thread(self.adb_manager.get_connected_devices)
             self.log_message(f"Found devices: {devices}")
             
             items = [f"{d['name']} ({d['id']})" for d in devices]
@@ -315,6 +425,11 @@ class adbfs(toga.App):
             device_id = selection.split('(')[-1].rstrip(')')
             self.current_device = device_id
             self.adb_manager.set_current_device(device_id)
+            self._remote_listing_cache.clear()
+            self._remote_listing_generation += 1
+            self._isdir_cache.clear()
+            self._device_has_cp = None
+            await self._open_shell_session()
             self.log_message(f"Device selected: {selection}")
             self.log_message(f"Current device set to: {self.current_device}")
             
@@ -348,7 +463,7 @@ class adbfs(toga.App):
         self.log_message("restart_adb_server method called.")
         async with busy_cursor(self.main_window):
             self.log_message("Attempting to restart ADB server...")
-            success, message = await self.loop.run_in_executor(None, self.adb_manager.restart_server)
+            success, message = await asyncio.to_thread(self.adb_manager.restart_server)
             if success:
                 self.log_message(message)
                 await self.refresh_devices()
@@ -356,54 +471,65 @@ class adbfs(toga.App):
                 self.log_message(f"Failed to restart ADB server: {message}")
                 await self.main_window.error_dialog("ADB Server Error", message)
 
-    async def show_adb_actions_window(self, widget):
-        # Create a new window
-        action_window = toga.Window(title="ADB Actions", size=(300, 200), closable=True)
-        
+    def _build_adb_actions_window(self):
+        # Built once and shown/hidden on demand; closing only hides it.
+        self._adb_actions_window = toga.Window(
+            title="ADB Actions",
+            size=(300, 200),
+            closable=True,
+            on_close=self._on_adb_actions_window_close,
+        )
+
         # Create a box to hold the buttons
         box = toga.Box(style=Pack(direction=COLUMN, padding=10))
 
-        async def pair_action_handler(widget):
-            await self._execute_adb_action(self.pair_device, action_window)
-
         # Pair Button
         pair_button = toga.Button(
             "Pair Device...",
-            on_press=pair_action_handler,
-            style=Pack(flex=1, padding=5)
+            on_press=self._pair_action_handler,
+            style=_ACTION_BUTTON
         )
         box.add(pair_button)
 
-        async def connect_action_handler(widget):
-            await self._execute_adb_action(self.connect_device, action_window)
-
         # Connect Button
         connect_button = toga.Button(
             "Connect Device...",
-            on_press=connect_action_handler,
-            style=Pack(flex=1, padding=5)
+            on_press=self._connect_action_handler,
+            style=_ACTION_BUTTON
         )
         box.add(connect_button)
 
-        async def restart_action_handler(widget):
-            await self._execute_adb_action(self.restart_adb_server, action_window)
-
         # Restart Server Button
         restart_button = toga.Button(
             "Restart ADB Server",
-            on_press=restart_action_handler,
-            style=Pack(flex=1, padding=5)
+            on_press=self._restart_action_handler,
+            style=_ACTION_BUTTON
         )
         box.add(restart_button)
 
-        action_window.content = box
-        action_window.show()
+        self._adb_actions_window.content = box
+
+    def _on_adb_actions_window_close(self, window, **kwargs):
+        window.hide()
+        return False # Keep the window around for the next show()
+
+    async def _pair_action_handler(self, widget):
+        await self._execute_adb_action(self.pair_device)
 
-    async def _execute_adb_action(self, action_func, window_to_close):
+    async def _connect_action_handler(self, widget):
+        await self._execute_adb_action(self.connect_device)
+
+    async def _restart_action_handler(self, widget):
+        await self._execute_adb_action(self.restart_adb_server)
+
+    async def show_adb_actions_window(self, widget):
+        self._adb_actions_window.show()
+
+    async def _execute_adb_action(self, action_func):
         # Execute the action
         await action_func()
-        # Close the window after the action is done
-        window_to_close.close()
+        # Hide the window after the action is done
+        self._adb_actions_window.hide()
 
     async def pair_device(self, widget=None):
         self.log_message("pair_device method called.")
@@ -414,11 +540,11 @@ class adbfs(toga.App):
             self.log_message(f"Pairing code entered.")
             async with busy_cursor(self.main_window):
                 self.log_message(f"Attempting to pair with {ip_address}...")
-                success, message = await self.loop.run_in_executor(None, self.adb_manager.pair_device, ip_address, pairing_code)
+                success, message = await asyncio.to_thread(self.adb_manager.pair_device, ip_address, pairing_code)
                 if success:
                     self.log_message(f"Pairing successful: {message}")
                     self.log_message(f"Attempting to connect to {ip_address} after successful pairing...")
-                    connect_success, connect_message = await self.loop.run_in_executor(None, self.adb_manager.connect_device, ip_address)
+                    connect_success, connect_message = await asyncio.to_thread(self.adb_manager.connect_device, ip_address)
                     if connect_success:
                         self.log_message(f"Connection successful after pairing: {connect_message}")
                     else:
@@ -437,7 +563,7 @@ class adbfs(toga.App):
             self.log_message(f"IP address for connecting: {ip_address}")
             async with busy_cursor(self.main_window):
                 self.log_message(f"Attempting to connect to {ip_address}...")
-                success, message = await self.loop.run_in_executor(None, self.adb_manager.connect_device, ip_address)
+                success, message = await asyncio.to_thread(self.adb_manager.connect_device, ip_address)
                 if success:
                     self.log_message(f"Connection successful: {message}")
                     await self.refresh_devices()
@@ -474,7 +600,10 @@ class adbfs(toga.App):
                             'type': "Parent",
                             'size': "-",
                             'date': "",
-                            'full_path': parent_path
+                            'full_path': parent_path,
+                            'filename': "..",
+                            '_size_bytes': -1,
+                            '_name_lower': "⬆️ .."
                         })
 
                     for item_name in os.listdir(self.current_local_path):
@@ -486,24 +615,31 @@ class adbfs(toga.App):
                             if is_directory:
                                 file_type = "Folder"
                                 size = ""
+                                size_bytes = 0
                             else:
                                 file_type = "File"
                                 size = get_human_readable_size(stat.st_size)
+                                size_bytes = stat.st_size
                             
                             date = datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+                            display_name = f"{ '📁' if is_directory else get_file_type_icon(item_name) } {item_name}"
                             
                             items.append({
-                                'name': f"{ '📁' if is_directory else get_file_type_icon(item_name) } {item_name}",
+                                'name': display_name,
                                 'type': file_type,
                                 'size': size,
                                 'date': date,
-                                'full_path': item_path 
+                                'full_path': item_path,
+                                'filename': item_name,
+                                # Sort keys, computed once per load instead of per comparison
+                                '_size_bytes': size_bytes,
+                                '_name_lower': display_name.lower()
                             })
                         except (OSError, IOError):
                             continue
                     return items
 
-                raw_items = await self.loop.run_in_executor(None, load_local_files)
+                raw_items = await asyncio.to_thread(load_local_files)
                 self.local_raw_data = raw_items # Store raw data
                 # Apply the current sort order after loading new data
                 self.sort_local_table(None)
@@ -516,62 +652,140 @@ class adbfs(toga.App):
         if not self.current_device:
             self.log_message("No device selected.")
             return
-        self.log_message(f"Loading remote files from: {self.current_remote_path}")
-        
+        path = self.current_remote_path
+        self.log_message(f"Loading remote files from: {path}")
+
+        cached = self._remote_listing_cache.get(path)
+        if cached is not None:
+            # Redraw from the cache right away and revalidate in the background.
+            self._remote_listing_cache.move_to_end(path)
+            self._show_remote_items(cached)
+            self.log_message(f"Loaded {len(cached)} remote items (cached).")
+            self._spawn_background(self._revalidate_remote_listing(path, cached))
+            return
+
         async with busy_cursor(self.main_window):
             try:
-                files = await self.loop.run_in_executor(None, self.adb_manager.get_file_list, f"'{self.current_remote_path}'")
-                
-                items = []
-                if self.current_remote_path != "/":
-                    parent_path = os.path.dirname(self.current_remote_path)
-                    if not parent_path or parent_path == ".":
-                        parent_path = "/"
-                    items.append({
-                        'name': "⬆️ ..",
-                        'type': "Parent",
-                        'size': "-",
-                        'date': "",
-                        'full_path': parent_path
-                    })
-
-                for file_info in files:
-                    # Initialize variables to ensure they always have a value
-                    icon, file_type, size = "📄", "File", ""
-
-                    is_directory = file_info.get('is_directory', False)
-                    is_link = file_info.get('is_link', False)
-                    name = file_info['name']
-                    
-                    if file_info.get('is_directory', False):
-                        file_type = "Folder"
-                        icon = "📁"
-                        size = ""
-                    elif file_info.get('is_link', False):
-                        file_type = "Link"
-                        icon = "🔗"
-                        size = ""
-                    # Reconstruct the full path from the unquoted base path and the name
-                    # to avoid path pollution from the adb_manager call.
-                    correct_full_path = os.path.join(self.current_remote_path, name).replace('//', '/')
-
-                    items.append({
-                        'name': f"{icon} {name}",
-                        'type': file_type,
-                        'size': size,
-                        'date': file_info['date'],
-                        'full_path': correct_full_path
-                    })
-
-                
-                raw_items = items # 'items' already contains dictionaries
-                self.remote_raw_data = raw_items # Store raw data
-                # Apply the current sort order after loading new data
-                self.sort_remote_table(None)
-                self.log_message(f"Loaded {len(raw_items)} remote items.")
-
+                items = await self._load_remote_items(path)
+                if path == self.current_remote_path:
+                    self._show_remote_items(items)
+                self.log_message(f"Loaded {len(items)} remote items.")
             except Exception as e:
                 self.log_message(f"Failed to load remote files: {e}")
+                return
+
+        if path != "/":
+            self._spawn_background(self._prefetch_remote_listing(self._remote_parent_path(path)))
+
+    def _remote_parent_path(self, path):
+        parent_path = posixpath.dirname(path)
+        if not parent_path or parent_path == ".":
+            parent_path = "/"
+        return parent_path
+
+    async def _load_remote_items(self, path):
+        """List a remote directory and build its table rows, caching successful listings."""
+        generation = self._remote_listing_generation
+        quoted = self._current_remote_path_quoted if path == self.current_remote_path else shlex.quote(path)
+        status, output = await self._run_remote(self.adb_manager.file_list_command(quoted))
+        if status != 0:
+            self.log_message(f"Listing {path} exited with status {status}.")
+            files = []
+        else:
+            files = self.adb_manager.parse_file_list(output, path)
+
+        items = []
+        if path != "/":
+            items.append({
+                'name': "⬆️ ..",
+                'type': "Parent",
+                'size': "-",
+                'date': "",
+                'full_path': self._remote_parent_path(path),
+                'filename': "..",
+                '_size_bytes': -1,
+                '_name_lower': "⬆️ .."
+            })
+
+        # Reconstruct full paths from the unquoted base path and the name
+        # to avoid path pollution from the adb_manager call.
+        base = path if path.endswith('/') else path + '/'
+
+        for file_info in files:
+            name = file_info['name']
+
+            if file_info.get('is_directory', False):
+                file_type, display_name = "Folder", '📁 ' + name
+            elif file_info.get('is_link', False):
+                file_type, display_name = "Link", '🔗 ' + name
+            else:
+                file_type, display_name = "File", '📄 ' + name
+            if file_type != "Link": # A fresh listing is authoritative for non-links
+                self._remember_is_directory(base + name, file_type == "Folder")
+
+            mtime = file_info.get('mtime')
+            if mtime is not None:
+                date = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+            else:
+                date = file_info['date']
+
+            size = file_info.get('size', '')
+            items.append({
+                'name': display_name,
+                'type': file_type,
+                'size': "",
+                'date': date,
+                'full_path': base + name,
+                'filename': name,
+                # Sort keys, computed once per load instead of per comparison
+                '_size_bytes': int(size) if file_type == "File" and size.isdigit() else 0,
+                '_name_lower': display_name.lower()
+            })
+
+        # A listing that raced with an invalidation may predate the change; don't cache it.
+        if status == 0 and generation == self._remote_listing_generation:
+            self._remote_listing_cache[path] = items
+            self._remote_listing_cache.move_to_end(path)
+            while len(self._remote_listing_cache) > REMOTE_LISTING_CACHE_SIZE:
+                self._remote_listing_cache.popitem(last=False)
+        return items
+
+    def _show_remote_items(self, items):
+        self.remote_raw_data = items # Store raw data
+        # Apply the current sort order after loading new data
+        self.sort_remote_table(None)
+
+    async def _revalidate_remote_listing(self, path, cached):
+        generation = self._remote_listing_generation
+        try:
+            items = await self._load_remote_items(path)
+        except Exception as e:
+            self.log_message(f"Failed to revalidate remote files: {e}")
+            return
+        if generation != self._remote_listing_generation:
+            return # Invalidated meanwhile; whoever invalidated reloads the listing
+        if path == self.current_remote_path and items != cached:
+            self._show_remote_items(items)
+            self.log_message(f"Remote listing for {path} changed, reloaded {len(items)} items.")
+
+    async def _prefetch_remote_listing(self, path):
+        if path in self._remote_listing_cache:
+            return
+        try:
+            await self._load_remote_items(path)
+        except Exception:
+            pass # Prefetching is best-effort
+
+    def _invalidate_remote_listing(self, *paths):
+        self._remote_listing_generation += 1
+        for path in paths:
+            self._remote_listing_cache.pop(path, None)
+
+    def _spawn_background(self, coro):
+        # Hold a reference so the task isn't garbage collected mid-flight.
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def on_local_file_activate(self, widget, row):
         print(f"DEBUG: Local file activated: {row.name if row else 'None'}") # Add debug print
@@ -592,12 +806,7 @@ class adbfs(toga.App):
             await self.refresh_local_file_list()
         else: # File
             try:
-                if platform.system() == 'Darwin':
-                    subprocess.run(['open', row.full_path])
-                elif platform.system() == 'Windows':
-                    os.startfile(row.full_path)
-                else:
-                    subprocess.run(['xdg-open', row.full_path])
+                await asyncio.to_thread(open_with_default_app, row.full_path)
             except Exception as e:
                 self.log_message(f"Could not open file: {e}")
 
@@ -608,54 +817,86 @@ class adbfs(toga.App):
         async with busy_cursor(self.main_window):
             self.log_message(f"Downloading {remote_path} to {local_path} and opening...")
 
-            def progress_handler(transferred, total):
-                def update_progress():
-                    if total > 0:
-                        self.progress_bar.value = (transferred / total) * 100
-                    else:
-                        if not self.progress_bar.is_running:
-                            self.progress_bar.start()
-                self.loop.call_soon_threadsafe(update_progress)
+            [progress_handler] = self._batch_progress_handlers(1)
 
             def download_job():
                 return self.adb_manager.pull_file(f"'{remote_path}'", local_path, progress_handler)
 
             self.progress_bar.value = 0
-            success = await self.loop.run_in_executor(None, download_job)
-            
-            if self.progress_bar.is_running:
-                self.progress_bar.stop()
-            self.progress_bar.value = 0
+            success = await self.loop.run_in_executor(self._transfer_executor, download_job)
+            self._reset_progress_bar()
 
             if success:
                 self.log_message("Download complete.")
                 await self.refresh_local_file_list()
                 try:
-                    if platform.system() == 'Darwin':
-                        subprocess.run(['open', local_path])
-                    elif platform.system() == 'Windows':
-                        os.startfile(local_path)
-                    else:
-                        subprocess.run(['xdg-open', local_path])
+                    await asyncio.to_thread(open_with_default_app, local_path)
                 except Exception as e:
                     self.log_message(f"Could not open file: {e}")
             else:
                 self.log_message("Download failed.")
                 await self.main_window.error_dialog("Error", "Download failed.")
 
+    async def _remote_is_directory(self, path):
+        key = (self.current_device, path)
+        is_dir = self._isdir_cache.get(key)
+        if is_dir is None:
+            status, _ = await self._run_remote(f"test -d {shlex.quote(path)}")
+            is_dir = status == 0
+            self._remember_is_directory(path, is_dir)
+        else:
+            self._isdir_cache.move_to_end(key)
+        return is_dir
+
+    async def _probe_remote_directories(self, paths):
+        """Warm the is-directory cache for many paths with a single shell round trip."""
+        unknown = [path for path in dict.fromkeys(paths) if (self.current_device, path) not in self._isdir_cache]
+        if not unknown:
+            return
+        command = "; ".join(f"[ -d {shlex.quote(path)} ] && echo 1 || echo 0" for path in unknown)
+        _, output = await self._run_remote(command)
+        answers = output.split()
+        if len(answers) != len(unknown):
+            return # Leave it to per-path probes
+        for path, answer in zip(unknown, answers):
+            self._remember_is_directory(path, answer == "1")
+
+    def _remember_is_directory(self, path, is_dir):
+        key = (self.current_device, path)
+        self._isdir_cache[key] = is_dir
+        self._isdir_cache.move_to_end(key) # Refreshing an entry makes it most recently used
+        while len(self._isdir_cache) > ISDIR_CACHE_SIZE:
+            self._isdir_cache.popitem(last=False)
+
+    def _invalidate_isdir_cache(self):
+        # Mutations can change what any cached path points at; drop the current device's entries.
+        for key in [key for key in self._isdir_cache if key[0] == self.current_device]:
+            del self._isdir_cache[key]
+
     async def resolve_remote_path(self, path):
+        # `readlink -f` chases the whole link chain on the device in one round trip.
+        status, output = await self._run_remote(f"readlink -f {shlex.quote(path)}")
+        resolved = output.strip()
+        if status == 0 and resolved.startswith('/'):
+            if resolved != path:
+                self.log_message(f"🔗 Following link to: {resolved}")
+            return resolved
+
+        # Fall back to following links one hop at a time on devices without `readlink -f`.
         for _ in range(10): # Limit to 10 levels of links to avoid infinite loops
-            is_link = await self.loop.run_in_executor(None, self.adb_manager.is_link, f"'{path}'")
-            if is_link:
-                target = await self.loop.run_in_executor(None, self.adb_manager.get_link_target, f"'{path}'")
+            quoted_path = shlex.quote(path)
+            status, _ = await self._run_remote(f"test -L {quoted_path}")
+            if status == 0:
+                status, output = await self._run_remote(f"readlink {quoted_path}")
+                target = output.strip() if status == 0 else None
                 if not target:
                     self.log_message(f"Could not resolve link target for {path}")
                     await self.main_window.error_dialog("Error", "Could not resolve link target.")
                     return None
                 
                 if not target.startswith('/'):
-                    target = os.path.join(os.path.dirname(path), target)
-                path = os.path.normpath(target).replace('\\', '/')
+                    target = _rjoin(posixpath.dirname(path), target)
+                path = posixpath.normpath(target)
                 self.log_message(f"🔗 Following link to: {path}")
             else:
                 return path
@@ -689,7 +930,7 @@ class adbfs(toga.App):
                 return  # Stop if link resolution fails
             path_to_process = final_path
 
-            is_dir = await self.loop.run_in_executor(None, self.adb_manager.is_directory, f"'{path_to_process}'")
+            is_dir = await self._remote_is_directory(path_to_process)
             if is_dir:
                 self.current_remote_path = path_to_process
                 self.remote_path_input.value = self.current_remote_path
@@ -707,7 +948,7 @@ class adbfs(toga.App):
         folder_name = await self._get_text_input("Create Folder", "Enter folder name:")
         if folder_name:
             try:
-                os.makedirs(os.path.join(self.current_local_path, folder_name), exist_ok=True)
+                await asyncio.to_thread(os.makedirs, os.path.join(self.current_local_path, folder_name), exist_ok=True)
                 await self.refresh_local_file_list()
             except Exception as e:
                 self.log_message(f"Error creating local directory: {e}")
@@ -719,25 +960,30 @@ class adbfs(toga.App):
             await self.main_window.info_dialog("Delete", "No file selected.")
             return
 
-        file_names = ", ".join([row.name.split(' ', 1)[1] if ' ' in row.name else row.name for row in selection])
-        message = f"Are you sure you want to delete {len(selection)} item(s): {file_names}?"
-        if len(message) > 200:
-            message = f"Are you sure you want to delete {len(selection)} item(s)?"
+        items_to_delete = [row for row in selection if row.type != "Parent"]
+
+        if not items_to_delete:
+            await self.main_window.info_dialog("Delete", "Cannot delete the parent directory entry.")
+            return
+
+        prefix = f"Are you sure you want to delete {len(items_to_delete)} item(s)"
+        file_names = short_name_list(items_to_delete, 200 - len(prefix) - 3)
+        message = f"{prefix}: {file_names}?" if file_names is not None else f"{prefix}?"
 
         confirmed = await self.main_window.confirm_dialog("Delete", message)
         if confirmed:
             success_count = 0
             failures = []
-            for row in selection:
+            for row in items_to_delete:
                 try:
-                    if os.path.isdir(row.full_path):
-                        shutil.rmtree(row.full_path)
-                    else:
-                        os.remove(row.full_path)
+                    # The row already knows whether it is a folder; no need to stat it again.
+                    await asyncio.to_thread(delete_local_path, row.full_path, row.type == "Folder")
                     success_count += 1
                 except Exception as e:
                     failures.append(row.name)
                     self.log_message(f"Error deleting local file {row.name}: {e}")
+            # Folders may have taken cached file stats with them.
+            self.file_manager.invalidate_stat()
             
             self.log_message(f"Successfully deleted {success_count} item(s).")
             if failures:
@@ -757,18 +1003,26 @@ class adbfs(toga.App):
             return
 
         row = selection[0]
-        old_name = row.name.split(' ', 1)[1] if ' ' in row.name else row.name
+        old_name = row.filename
         new_name = await self._get_text_input("Rename", "Enter new name:", initial_value=old_name)
 
-        if new_name and new_name != old_name:
-            old_path = row.full_path
-            new_path = os.path.join(self.current_local_path, new_name)
-            try:
-                os.rename(old_path, new_path)
-                await self.refresh_local_file_list()
-            except Exception as e:
-                self.log_message(f"Error renaming local file: {e}")
-                await self.main_window.error_dialog("Error", f"Could not rename file: {e}")
+        if not new_name:
+            return
+
+        old_path = row.full_path
+        new_path = os.path.join(self.current_local_path, new_name)
+        if new_path == old_path:
+            return # Nothing to do
+
+        try:
+            # os.replace behaves the same on every platform (os.rename fails on Windows if the target exists).
+            await asyncio.to_thread(os.replace, old_path, new_path)
+            self.file_manager.invalidate_stat(old_path)
+            self.file_manager.invalidate_stat(new_path)
+            await self.refresh_local_file_list()
+        except Exception as e:
+            self.log_message(f"Error renaming local file: {e}")
+            await self.main_window.error_dialog("Error", f"Could not rename file: {e}")
 
     async def upload_selected_local_file(self, widget):
         if not self.current_device:
@@ -789,33 +1043,39 @@ class adbfs(toga.App):
             await self.main_window.info_dialog("Upload", "Skipping folders. Only files will be uploaded.")
 
         async with busy_cursor(self.main_window):
-            failures = []
-            for row in files_to_upload:
+            file_names = []
+            jobs = []
+            handlers = self._batch_progress_handlers(len(files_to_upload))
+            for row, progress_handler in zip(files_to_upload, handlers):
                 local_path = row.full_path
-                file_name = row.name.split(' ', 1)[1] if ' ' in row.name else row.name
-                remote_path = os.path.join(self.current_remote_path, file_name).replace('\\', '/')
+                file_name = row.filename
+                remote_path = _rjoin(self.current_remote_path, file_name)
 
                 self.log_message(f"Uploading {local_path} to {remote_path}")
-                
-                def progress_handler(transferred, total):
-                    def update_progress():
-                        if total > 0:
-                            self.progress_bar.value = (transferred / total) * 100
-                    self.loop.call_soon_threadsafe(update_progress)
-
-                def upload_job():
-                    return self.adb_manager.push_file(local_path, f"'{remote_path}'", progress_handler)
-                self.progress_bar.value = 0
-                success = await self.loop.run_in_executor(None, upload_job)
-                self.progress_bar.value = 0
+                file_names.append(file_name)
+                jobs.append(self.loop.run_in_executor(
+                    self._transfer_executor, self.adb_manager.push_file, local_path, f"'{remote_path}'", progress_handler
+                ))
 
-                if success:
+            # Transfers are independent, so run them side by side on the transfer pool.
+            self.progress_bar.value = 0
+            results = await asyncio.gather(*jobs, return_exceptions=True)
+            self._reset_progress_bar()
+
+            failures = []
+            for file_name, result in zip(file_names, results):
+                if result is True:
                     self.log_message(f"Upload of {file_name} complete.")
                 else:
-                    self.log_message(f"Upload of {file_name} failed.")
+                    self.log_message(f"Upload of {file_name} failed." + (f" ({result})" if isinstance(result, Exception) else ""))
                     failures.append(file_name)
             
-            await self.refresh_remote_file_list()
+            # Pushes may have replaced paths (and created parent folders) we have cached answers for.
+            self._invalidate_isdir_cache()
+            self._invalidate_remote_listing(self.current_remote_path)
+            if len(failures) < len(file_names):
+                # Nothing new to show if every push failed; skip the listing round trip.
+                await self.refresh_remote_file_list()
 
             if failures:
                 await self.main_window.error_dialog("Error", f"Failed to upload some files: {', '.join(failures)}")
@@ -829,12 +1089,14 @@ class adbfs(toga.App):
         
         folder_name = await self._get_text_input("Create Remote Folder", "Enter folder name:")
         if folder_name:
-            remote_path = os.path.join(self.current_remote_path, folder_name).replace('\\', '/')
+            remote_path = _rjoin(self.current_remote_path, folder_name)
             async with busy_cursor(self.main_window):
                 self.log_message(f"Creating remote directory: {remote_path}")
-                success = await self.loop.run_in_executor(None, self.adb_manager.create_directory, f"'{remote_path}'")
+                success = await asyncio.to_thread(self.adb_manager.create_directory, f"'{remote_path}'")
                 if success:
                     self.log_message("Directory created.")
+                    self._invalidate_isdir_cache()
+                    self._invalidate_remote_listing(self.current_remote_path)
                     await self.refresh_remote_file_list()
                 else:
                     self.log_message("Failed to create directory.")
@@ -855,10 +1117,9 @@ class adbfs(toga.App):
             await self.main_window.info_dialog("Delete", "Cannot delete the parent directory entry.")
             return
 
-        file_names = ", ".join([row.name.split(' ', 1)[1] if ' ' in row.name else row.name for row in items_to_delete])
-        message = f"Are you sure you want to delete {len(items_to_delete)} item(s): {file_names}?"
-        if len(message) > 200: # Avoid overly long dialog messages
-            message = f"Are you sure you want to delete {len(items_to_delete)} item(s)?"
+        prefix = f"Are you sure you want to delete {len(items_to_delete)} item(s)"
+        file_names = short_name_list(items_to_delete, 200 - len(prefix) - 3) # Avoid overly long dialog messages
+        message = f"{prefix}: {file_names}?" if file_names is not None else f"{prefix}?"
 
         confirmed = await self.main_window.confirm_dialog("Delete", message)
         if confirmed:
@@ -868,11 +1129,13 @@ class adbfs(toga.App):
                     # Quote the path to handle spaces and special characters
                     quoted_path = f"'{row.full_path}'"
                     self.log_message(f"Deleting remote file: {quoted_path}")
-                    success = await self.loop.run_in_executor(None, self.adb_manager.delete_file, quoted_path)
+                    success = await asyncio.to_thread(self.adb_manager.delete_file, quoted_path)
                     if not success:
                         failures.append(row.name)
                         self.log_message(f"Failed to delete file: {quoted_path}")
                 
+                self._invalidate_isdir_cache()
+                self._invalidate_remote_listing(self.current_remote_path, *(row.full_path for row in items_to_delete))
                 await self.refresh_remote_file_list()
 
                 if failures:
@@ -901,22 +1164,24 @@ class adbfs(toga.App):
             await self.main_window.info_dialog("Rename", "Cannot rename the parent directory entry.")
             return
 
-        old_name = row.name.split(' ', 1)[1] if ' ' in row.name else row.name
+        old_name = row.filename
         new_name = await self._get_text_input("Rename", "Enter new name:", initial_value=old_name)
 
         if new_name and new_name != old_name:
             old_path = row.full_path
-            new_path = os.path.join(self.current_remote_path, new_name).replace('\\', '/')
+            new_path = _rjoin(self.current_remote_path, new_name)
             
             async with busy_cursor(self.main_window):
                 # Quote the paths to handle spaces and special characters
                 quoted_old_path = f"'{old_path}'"
                 quoted_new_path = f"'{new_path}'"
                 self.log_message(f"Renaming remote file {quoted_old_path} to {quoted_new_path}")
-                success = await self.loop.run_in_executor(None, self.adb_manager.rename_file, quoted_old_path, quoted_new_path)
+                success = await asyncio.to_thread(self.adb_manager.rename_file, quoted_old_path, quoted_new_path)
                 
                 if success:
                     self.log_message("Rename successful.")
+                    self._invalidate_isdir_cache()
+                    self._invalidate_remote_listing(self.current_remote_path, old_path)
                     await self.refresh_remote_file_list()
                 else:
                     self.log_message("Rename failed.")
@@ -940,38 +1205,30 @@ class adbfs(toga.App):
             await self.main_window.info_dialog("Download", "Skipping folders. Only files will be downloaded.")
 
         async with busy_cursor(self.main_window):
-            failures = []
-            for row in files_to_download:
+            file_names = []
+            jobs = []
+            handlers = self._batch_progress_handlers(len(files_to_download))
+            for row, progress_handler in zip(files_to_download, handlers):
                 remote_path = row.full_path
-                file_name = row.name.split(' ', 1)[1] if ' ' in row.name else row.name
+                file_name = row.filename
                 local_path = os.path.join(self.current_local_path, file_name)
 
                 self.log_message(f"Downloading {remote_path} to {local_path}")
+                file_names.append(file_name)
+                jobs.append(self.loop.run_in_executor(
+                    self._transfer_executor, self.adb_manager.pull_file, remote_path, local_path, progress_handler
+                ))
 
-                def progress_handler(transferred, total):
-                    def update_progress():
-                        if total > 0:
-                            self.progress_bar.value = (transferred / total) * 100
-                        else:
-                            if not self.progress_bar.is_running:
-                                self.progress_bar.start()
-                    
-                    self.loop.call_soon_threadsafe(update_progress)
-
-                def download_job():
-                    return self.adb_manager.pull_file(remote_path, local_path, progress_handler)
-
-                self.progress_bar.value = 0
-                success = await self.loop.run_in_executor(None, download_job)
-                
-                if self.progress_bar.is_running:
-                    self.progress_bar.stop()
-                self.progress_bar.value = 0
+            self.progress_bar.value = 0
+            results = await asyncio.gather(*jobs, return_exceptions=True)
+            self._reset_progress_bar()
 
-                if success:
+            failures = []
+            for file_name, result in zip(file_names, results):
+                if result is True:
                     self.log_message(f"Download of {file_name} complete.")
                 else:
-                    self.log_message(f"Download of {file_name} failed.")
+                    self.log_message(f"Download of {file_name} failed." + (f" ({result})" if isinstance(result, Exception) else ""))
                     failures.append(file_name)
             
             await self.refresh_local_file_list()
@@ -981,7 +1238,49 @@ class adbfs(toga.App):
             else:
                 self.log_message("All selected files downloaded successfully.")
 
-    def sort_table(self, table, raw_data, column, sort_column_attr, sort_direction_attr):
+    def _batch_progress_handlers(self, count):
+        """Build one progress callback per transfer; together they drive the progress bar.
+
+        Updates are capped at ~30 Hz across the whole batch so chunk-level callbacks
+        don't flood the event loop; each transfer's final update always goes through.
+        At most one update is queued on the loop at a time: it reads the latest
+        fractions when it runs, so later callbacks only need to record theirs.
+        """
+        fractions = [0.0] * count
+        last_update = [0.0]
+        pending = [False]
+
+        def update_progress():
+            pending[0] = False
+            self.progress_bar.value = sum(fractions) / count * 100
+
+        def start_indeterminate():
+            if not self.progress_bar.is_running:
+                self.progress_bar.start()
+
+        def make_handler(index):
+            def progress_handler(transferred, total):
+                if total > 0:
+                    fractions[index] = transferred / total
+                    now = time.monotonic()
+                    if now - last_update[0] < PROGRESS_UPDATE_INTERVAL and transferred != total:
+                        return
+                    last_update[0] = now
+                    if not pending[0]:
+                        pending[0] = True
+                        self.loop.call_soon_threadsafe(update_progress)
+                else:
+                    self.loop.call_soon_threadsafe(start_indeterminate)
+            return progress_handler
+
+        return [make_handler(index) for index in range(count)]
+
+    def _reset_progress_bar(self):
+        if self.progress_bar.is_running:
+            self.progress_bar.stop()
+        self.progress_bar.value = 0
+
+    def sort_table(self, table, raw_data, column, sort_column_attr, sort_direction_attr, sorted_view_attr):
         if column is None:
             # Re-apply the current sort order without toggling
             column = getattr(self, sort_column_attr)
@@ -999,44 +1298,28 @@ class adbfs(toga.App):
             setattr(self, sort_column_attr, column)
             setattr(self, sort_direction_attr, new_direction)
 
-        parent_item = []
-        data_to_sort = []
+        # Handle parent item (⬆️ ..) separately: sort the rest without copying it
+        # out first, then put the parent back in front.
+        has_parent = bool(raw_data) and raw_data[0].get('type') == 'Parent'
+        data_to_sort = islice(raw_data, 1, None) if has_parent else raw_data
 
-        # Handle parent item (⬆️ ..) separately
-        if raw_data and raw_data[0].get('type') == 'Parent':
-            parent_item = [raw_data[0]]
-            data_to_sort = raw_data[1:]
-        else:
-            data_to_sort = raw_data
+        # Sort into a separate view so raw_data keeps its load order.
+        sorted_view = sorted(data_to_sort, key=SORT_KEYS[column], reverse=new_direction == -1)
+        if has_parent:
+            sorted_view.insert(0, raw_data[0])
 
-        def sort_key(item): # 'item' is now a dictionary
-            val = item.get(column) # Access dictionary key
-            if column == 'size':
-                if val == '-': return -1
-                try:
-                    # Need to handle formatted size for sorting
-                    if isinstance(val, str):
-                        num, unit = val.split()
-                        units = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4, 'PB': 1024**5}
-                        return float(num) * units.get(unit, 1)
-                    return val # If it's already a number
-                except:
-                    return 0
-            if column == 'date':
-                if not val: return ""
-                return val
-            # For 'name' and 'type', ensure case-insensitive sorting
-            return str(val).lower() if val is not None else ""
-
-        data_to_sort.sort(key=sort_key, reverse=new_direction == -1)
-        
-        table.data = parent_item + data_to_sort
+        # Pushing rows rebuilds the whole native table; skip it when the order didn't change.
+        current_view = getattr(self, sorted_view_attr)
+        if len(current_view) == len(sorted_view) and all(a is b for a, b in zip(current_view, sorted_view)):
+            return
+        setattr(self, sorted_view_attr, sorted_view)
+        table.data = sorted_view
 
     def sort_local_table(self, column):
-        self.sort_table(self.local_file_table, self.local_raw_data, column, 'local_sort_column', 'local_sort_direction')
+        self.sort_table(self.local_file_table, self.local_raw_data, column, 'local_sort_column', 'local_sort_direction', 'local_sorted_view')
 
     def sort_remote_table(self, column):
-        self.sort_table(self.remote_file_table, self.remote_raw_data, column, 'remote_sort_column', 'remote_sort_direction')
+        self.sort_table(self.remote_file_table, self.remote_raw_data, column, 'remote_sort_column', 'remote_sort_direction', 'remote_sorted_view')
 
     def update_clipboard_label(self):
         if not self.clipboard or not self.clipboard.get('paths'):
@@ -1078,6 +1361,63 @@ class adbfs(toga.App):
         self.update_clipboard_label()
         self.log_message(f"Cut {len(paths)} items to clipboard.")
 
+    async def _device_supports_copy(self):
+        # Probed once per device; only very old devices lack a `cp` binary.
+        if self._device_has_cp is None:
+            status, _ = await self._run_remote("command -v cp")
+            self._device_has_cp = status == 0
+        return self._device_has_cp
+
+    async def _paste_remote_item(self, operation, src_path, destination_dir, use_device_copy, temp_dir=None, index=0):
+        """Copy or move one clipboard entry; returns a failure label, or None on success/skip."""
+        file_name = os.path.basename(src_path)
+        dest_path = _rjoin(destination_dir, file_name)
+
+        if operation == 'copy' and use_device_copy:
+            # Copy on the device itself rather than pulling and pushing the data over adb.
+            self.log_message(f"Copying {src_path} to {dest_path}")
+            success = await self.loop.run_in_executor(
+                self._transfer_executor, self.adb_manager.copy_file, shlex.quote(src_path), shlex.quote(dest_path)
+            )
+            if not success:
+                self.log_message(f"Failed to copy {file_name}.")
+                return file_name
+            return None
+
+        if operation == 'copy':
+            # Fallback for devices without `cp`: round-trip through a local temp file.
+            is_dir = await self._remote_is_directory(src_path)
+            if is_dir:
+                self.log_message(f"Copying directories is not supported yet. Skipping {file_name}.")
+                return f"{file_name} (is a directory)"
+
+            self.log_message(f"Copying {src_path} to {dest_path}")
+            # The temp directory is shared by the whole paste; prefix with the index so names can't collide.
+            local_temp_path = os.path.join(temp_dir, f"{index}_{file_name}")
+
+            self.log_message(f"Pulling {src_path} to temporary location...")
+            pull_success = await self.loop.run_in_executor(self._transfer_executor, self.adb_manager.pull_file, f"'{src_path}'", local_temp_path, None)
+
+            if not pull_success:
+                self.log_message(f"Failed to pull {file_name}.")
+                return file_name
+
+            self.log_message(f"Pushing from temporary location to {dest_path}...")
+            push_success = await self.loop.run_in_executor(self._transfer_executor, self.adb_manager.push_file, local_temp_path, f"'{dest_path}'", None)
+            await asyncio.to_thread(delete_local_path, local_temp_path, False)
+            if not push_success:
+                self.log_message(f"Failed to push {file_name}.")
+                return file_name
+            return None
+
+        # cut (move)
+        self.log_message(f"Moving {src_path} to {dest_path}")
+        success = await asyncio.to_thread(self.adb_manager.rename_file, f"'{src_path}'", f"'{dest_path}'")
+        if not success:
+            self.log_message(f"Failed to move {file_name}.")
+            return file_name
+        return None
+
     async def paste_remote_files(self, widget):
         if not self.clipboard or not self.clipboard.get('paths'):
             await self.main_window.info_dialog("Paste", "Clipboard is empty.")
@@ -1087,69 +1427,60 @@ class adbfs(toga.App):
         source_paths = self.clipboard['paths']
         destination_dir = self.current_remote_path
 
-        for src_path in source_paths:
-            if destination_dir.startswith(src_path + '/'):
-                await self.main_window.error_dialog("Paste Error", f"Cannot {operation} '{os.path.basename(src_path)}' into a subdirectory of itself.")
-                return
+        # One pass over the clipboard: reject pastes into a source's own subtree and
+        # set aside items that already live in the destination directory.
+        nested, pending, in_destination = split_paste_sources(source_paths, destination_dir)
+        if nested is not None:
+            await self.main_window.error_dialog("Paste Error", f"Cannot {operation} '{os.path.basename(nested)}' into a subdirectory of itself.")
+            return
+        failures = []
+        if operation == 'copy': # cut into the same directory is a no-op
+            for src_path in in_destination:
+                file_name = os.path.basename(src_path)
+                self.log_message(f"Copying a file into the same directory is not supported yet. Skipping {file_name}.")
+                failures.append(f"{file_name} (copy to same dir)")
 
         async with busy_cursor(self.main_window):
-            failures = []
-            for src_path in source_paths:
-                file_name = os.path.basename(src_path)
-                dest_path = os.path.join(destination_dir, file_name).replace('\\', '/')
-
-                if os.path.dirname(src_path.rstrip('/')) == destination_dir.rstrip('/'):
-                    if operation == 'copy':
-                        self.log_message(f"Copying a file into the same directory is not supported yet. Skipping {file_name}.")
-                        failures.append(f"{file_name} (copy to same dir)")
-                        continue
-                    else: # cut
-                        continue
-                
-                if operation == 'copy':
-                    is_dir = await self.loop.run_in_executor(None, self.adb_manager.is_directory, src_path)
-                    if is_dir:
-                        self.log_message(f"Copying directories is not supported yet. Skipping {file_name}.")
-                        failures.append(f"{file_name} (is a directory)")
-                        continue
-
-                if operation == 'copy':
-                    self.log_message(f"Copying {src_path} to {dest_path}")
-                    import tempfile
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        local_temp_path = os.path.join(temp_dir, file_name)
-                        
-                        self.log_message(f"Pulling {src_path} to temporary location...")
-                        pull_success = await self.loop.run_in_executor(None, self.adb_manager.pull_file, f"'{src_path}'", local_temp_path, None)
-                        
-                        if pull_success:
-                            self.log_message(f"Pushing from temporary location to {dest_path}...")
-                            push_success = await self.loop.run_in_executor(None, self.adb_manager.push_file, local_temp_path, f"'{dest_path}'", None)
-                            if not push_success:
-                                failures.append(file_name)
-                                self.log_message(f"Failed to push {file_name}.")
-                        else:
-                            failures.append(file_name)
-                            self.log_message(f"Failed to pull {file_name}.")
-
-                else: # cut (move)
-                    self.log_message(f"Moving {src_path} to {dest_path}")
-                    success = await self.loop.run_in_executor(None, self.adb_manager.rename_file, f"'{src_path}'", f"'{dest_path}'")
-                    if not success:
-                        failures.append(file_name)
-                        self.log_message(f"Failed to move {file_name}.")
+            use_device_copy = operation == 'copy' and await self._device_supports_copy()
+            use_temp_copy = operation == 'copy' and not use_device_copy
+            if use_temp_copy:
+                # The fallback path skips directories; probe them all in one go up front.
+                await self._probe_remote_directories(pending)
+            # One temp directory for the whole paste instead of one per item.
+            with tempfile.TemporaryDirectory() if use_temp_copy else nullcontext() as temp_dir:
+                results = await asyncio.gather(
+                    *(self._paste_remote_item(operation, src_path, destination_dir, use_device_copy, temp_dir, i)
+                      for i, src_path in enumerate(pending)),
+                    return_exceptions=True,
+                )
+            any_success = False
+            for src_path, result in zip(pending, results):
+                if result is None:
+                    any_success = True
+                elif isinstance(result, Exception):
+                    self.log_message(f"Failed to {operation} {src_path}: {result}")
+                    failures.append(os.path.basename(src_path))
+                elif result:
+                    failures.append(result)
 
         if operation == 'cut':
             self.clipboard = None 
             self.update_clipboard_label()
 
-        await self.refresh_remote_file_list()
+        self._invalidate_isdir_cache()
+        self._invalidate_remote_listing(destination_dir)
+        if operation == 'cut':
+            self._invalidate_remote_listing(*source_paths, *{posixpath.dirname(p.rstrip('/')) or '/' for p in source_paths})
 
         if failures:
             await self.main_window.error_dialog("Paste Error", f"Failed to {operation} some items: {', '.join(failures)}")
         else:
             self.log_message(f"Paste ({operation}) successful.")
 
+        # A single listing after the whole batch (and after any error dialog), and none at all if nothing changed.
+        if any_success:
+            await self.refresh_remote_file_list()
+
 
 def main():
     return adbfs()
\ No newline at end of file
@@ -3,47 +3,274 @@
 파일 다운로드/업로드 진행률 추적 및 상태 관리
 """
 
+import asyncio
 import os
+import posixpath
+import queue
+import re
+import shlex
+import stat
+import subprocess
+import sys
+import tarfile
 import threading
 import time
-from typing import Callable, Optional, Dict, List, Any
-from .adb_manager import ADBManager
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import count
+from typing import Callable, Optional, Dict, List, Any, Tuple, IO, Iterator, NewType
+from .adb_manager import ADBManager, ADBShellSession
+
+# 스트림/로컬 복사에서 한 번에 읽고 쓰는 크기 (진행률 보고 단위이기도 함)
+_COPY_CHUNK = 1 << 20
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 10MB 미만 크기 문자열을 미리 만들어 둔 표 (디렉토리 목록 대부분이 이 범위)
+# 인덱스는 바이트 수, 또는 KB/MB 단위 값의 소수 첫째 자리까지를 정수로 만든 값
+_SMALL_LIMIT = 10 << 20
+_SMALL_BYTES = ("0 B",) + tuple(f"{i:.1f} B" for i in range(1, 1024))
+_SMALL_KB = tuple(f"{i / 10:.1f} KB" for i in range(10240 + 1))
+_SMALL_MB = tuple(f"{i / 10:.1f} MB" for i in range(100 + 1))
+
+
+def _tenths(size_bytes: int, shift: int) -> int:
+    """`size_bytes / 2**shift`를 소수 첫째 자리에서 반올림해 10배한 정수 (`.1f` 서식과 같은 짝수 반올림)"""
+    q, r = divmod(size_bytes * 10, 1 << shift)
+    half = 1 << (shift - 1)
+    if r > half or (r == half and q & 1):
+        q += 1
+    return q
+
+
+# 이보다 작은 파일은 진행률 추적 없이 바로 전송
+SMALL_FILE_THRESHOLD = 256 * 1024
+
+# 진행률 콜백 최소 간격 (UI가 따라갈 수 있도록 약 30Hz로 제한)
+PROGRESS_MIN_INTERVAL = 1 / 30
+
+# 로컬 파일 stat 결과 캐시 크기 (LRU)와 유효 시간 (초, 앱 밖에서 바뀐 파일도 곧 다시 읽도록)
+STAT_CACHE_SIZE = 4096
+STAT_CACHE_TTL = 2.0
+
+# 동시에 실행할 비동기 전송 수
+MAX_CONCURRENT_TRANSFERS = 4
+
+# 이보다 큰 파일은 여러 구간으로 나눠 동시에 받음 (`dd` 구간 읽기)
+RANGED_PULL_THRESHOLD = 64 << 20
+RANGED_PULL_PARTS = 4
+
+# 취소된 adb 프로세스가 스스로 끝나기를 기다리는 시간 (이후 강제 종료)
+CANCEL_GRACE_PERIOD = 2
+
+# `adb pull/push -p` 출력의 진행률 표시 (예: "[ 45%] /sdcard/a.jpg")
+_PERCENT_PATTERN = re.compile(rb'\[\s*(\d+)%\]')
+
+# 비동기 전송 ID (FileManager 안에서 1부터 차례로 발급)
+TransferHandle = NewType("TransferHandle", int)
+
+# `get_active_transfers`가 돌려주는 진행 중 전송 정보
+TransferInfo = namedtuple("TransferInfo", "thread_id type remote_path local_path")
 
 class FileManager:
     """파일 전송을 관리하고 진행률을 추적하는 클래스"""
     
     def __init__(self, adb_manager: ADBManager):
         self.adb_manager = adb_manager
-        self.transfer_threads = {}
-        self.transfer_status = {}
+        self.transfer_threads: Dict[TransferHandle, Dict[str, Any]] = {}
+        self.transfer_status: Dict[TransferHandle, str] = {}
+        self._handles = count(1)
+        # 진행 중인 전송 ID -> TransferInfo, 그리고 변경될 때만 다시 만드는 그 튜플 스냅샷
+        self._active: Dict[int, TransferInfo] = {}
+        self._active_snapshot: Optional[Tuple[TransferInfo, ...]] = ()
+        # transfer_threads / transfer_status / _active는 작업자 스레드에서도 변경되므로 항상 이 잠금 안에서 접근
+        self._lock = threading.Lock()
+        # 비동기 전송과 지속형 셸 세션은 모두 전용 이벤트 루프 스레드 하나에서 처리
+        # (전송마다 스레드를 만들지 않고, 동시 전송 수는 세마포어로 제한)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._transfer_slots = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+        # 크기 조회/디렉토리 생성 같은 짧은 셸 명령어는 하나의 `adb shell` 세션으로 보냄
+        self._shell: Optional[ADBShellSession] = None
+        # 동시에 재연결하려는 전송들이 각자 세션을 열지 않도록 확인과 재연결을 한 번에 하나씩 처리
+        # (세마포어와 마찬가지로 처음 사용하는 전용 루프에 묶임)
+        self._shell_lock = asyncio.Lock()
+        # 비동기 전송의 진행률/상태/완료 콜백은 별도 스레드가 차례로 실행
+        # (느린 콜백이 이벤트 루프와 다른 전송을 막지 않도록, 넣을 때 막히지 않는 무제한 대기열 사용)
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        # 이미 만들어 둔 로컬 디렉토리 (같은 폴더로 받는 파일마다 stat/mkdir 하지 않도록)
+        self._known_dirs: set = set()
+        # 로컬 경로 -> os.stat 결과 (FileManager가 쓰는 파일은 기록 후 무효화, 잠금 안에서 접근)
+        self._stat_cache: OrderedDict = OrderedDict()
+
+    def shutdown(self):
+        """진행 중인 비동기 전송을 취소하고 셸 세션과 이벤트 루프 종료"""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown_async(), loop).result(timeout=5)
+            except Exception:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            # 이미 쌓인 콜백을 모두 실행한 뒤 디스패처 종료
+            self._events.put(None)
+
+    async def _shutdown_async(self):
+        # 전송 작업을 취소하고 adb 프로세스가 정리될 때까지 잠시 기다림
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=2)
+        await self._close_shell()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='adbfs-file-manager', daemon=True).start()
+                threading.Thread(target=self._drain_events, name='adbfs-file-manager-events', daemon=True).start()
+            return self._loop
+
+    def _drain_events(self):
+        while (event := self._events.get()) is not None:
+            callback, args = event
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"콜백 실행 실패: {e}")
+
+    def _deferred(self, callback: Optional[Callable]) -> Optional[Callable]:
+        """호출을 콜백 대기열에 넣기만 하는 함수로 감싸기"""
+        if callback is None:
+            return None
+        return lambda *args: self._events.put((callback, args))
+
+    def _shell_run(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        """지속형 셸 세션으로 명령어 실행 후 (종료 코드, 표준출력)을 반환 (세션을 쓸 수 없으면 단발성 실행)"""
+        return asyncio.run_coroutine_threadsafe(self._shell_command(command, timeout), self._ensure_loop()).result()
+
+    async def _shell_command(self, command: str, timeout: float = 10) -> Tuple[int, str]:
+        try:
+            return await self._shell_run_async(command, timeout)
+        except (ConnectionError, OSError, asyncio.TimeoutError):
+            return await asyncio.to_thread(self.adb_manager.shell, command, timeout)
+
+    async def _shell_run_async(self, command: str, timeout: float) -> Tuple[int, str]:
+        async with self._shell_lock:
+            # 디바이스가 바뀌었거나 세션이 끊겼으면 새로 연결
+            if self._shell is None or not self._shell.is_open or self._shell.device_id != self.adb_manager.current_device:
+                await self._close_shell()
+                shell = self.adb_manager.open_shell_session()
+                if shell is None:
+                    raise ConnectionError("현재 디바이스가 설정되지 않음")
+                await shell.open()
+                self._shell = shell
+            shell = self._shell
+        return await shell.run(command, timeout)
+
+    async def _close_shell(self):
+        shell, self._shell = self._shell, None
+        if shell is not None:
+            await shell.close()
+
+    def _remote_size(self, remote_path: str) -> Optional[int]:
+        """원격 파일 크기 조회 (실패 시 None)"""
+        return asyncio.run_coroutine_threadsafe(self._remote_size_async(remote_path), self._ensure_loop()).result()
+
+    async def _remote_size_async(self, remote_path: str) -> Optional[int]:
+        status, output = await self._shell_command(f"stat -c %s {shlex.quote(remote_path)}", timeout=5)
+        output = output.strip()
+        return int(output) if status == 0 and output.isdigit() else None
+
+    def _make_remote_dir(self, remote_dir: str) -> bool:
+        """원격 디렉토리 생성 (상위 디렉토리 포함, 이미 있으면 그대로 성공)"""
+        return asyncio.run_coroutine_threadsafe(self._make_remote_dir_async(remote_dir), self._ensure_loop()).result()
+
+    async def _make_remote_dir_async(self, remote_dir: str) -> bool:
+        status, _ = await self._shell_command(f"mkdir -p {shlex.quote(remote_dir)}")
+        return status == 0
         
+    @staticmethod
+    def _throttle(callback: Callable[[int, int, str], None],
+                  min_interval: float = PROGRESS_MIN_INTERVAL) -> Callable[[int, int, str], None]:
+        """진행률 콜백을 최대 `min_interval`마다 한 번만 전달하도록 감싸기 (완료 보고는 항상 전달)"""
+        last = [float('-inf')]
+
+        def throttled(transferred: int, total: int, label: str):
+            now = time.monotonic()
+            if now - last[0] >= min_interval or transferred == total:
+                last[0] = now
+                callback(transferred, total, label)
+
+        return throttled
+
+    def _stat(self, path: str) -> os.stat_result:
+        """캐시된 `os.stat` 결과 반환 (`STAT_CACHE_TTL`이 지났으면 다시 조회, 없는 파일은 캐시하지 않고 OSError 발생)"""
+        with self._lock:
+            entry = self._stat_cache.get(path)
+            if entry is not None:
+                st, cached_at = entry
+                if time.monotonic() - cached_at < STAT_CACHE_TTL:
+                    self._stat_cache.move_to_end(path)
+                    return st
+                del self._stat_cache[path]
+        st = os.stat(path)
+        self._remember_stat(path, st)
+        return st
+
+    def _remember_stat(self, path: str, st: os.stat_result):
+        with self._lock:
+            self._stat_cache[path] = (st, time.monotonic())
+            self._stat_cache.move_to_end(path)
+            if len(self._stat_cache) > STAT_CACHE_SIZE:
+                self._stat_cache.popitem(last=False)
+
+    def invalidate_stat(self, path: Optional[str] = None):
+        """로컬 파일 stat 캐시 무효화 (`path`가 없으면 전체)"""
+        with self._lock:
+            if path is None:
+                self._stat_cache.clear()
+            else:
+                self._stat_cache.pop(path, None)
+
+    def _ensure_local_dir(self, local_dir: str):
+        if local_dir and local_dir not in self._known_dirs:
+            os.makedirs(local_dir, exist_ok=True)
+            self._known_dirs.add(local_dir)
+
     def download_file(self, remote_path: str, local_path: str, 
                      progress_callback: Optional[Callable[[int, int, str], None]] = None,
                      status_callback: Optional[Callable[[str], None]] = None) -> bool:
         """파일을 디바이스에서 로컬로 다운로드"""
-        
-        def progress_wrapper(transferred: int, total: int):
-            if progress_callback:
-                progress_callback(transferred, total, "다운로드 중...")
-        
-        def status_wrapper(message: str):
-            if status_callback:
-                status_callback(message)
-        
+        if progress_callback:
+            progress_callback = self._throttle(progress_callback)
         # 로컬 디렉토리 생성
         local_dir = os.path.dirname(local_path)
-        if local_dir and not os.path.exists(local_dir):
-            os.makedirs(local_dir, exist_ok=True)
-        
-        status_wrapper(f"다운로드 시작: {os.path.basename(remote_path)}")
+        self._ensure_local_dir(local_dir)
         
-        # 파일 전송 실행
-        success = self.adb_manager.pull_file(remote_path, local_path, progress_wrapper)
+        # 상태 문자열은 받는 쪽이 있을 때만 만듦
+        if status_callback:
+            status_callback(f"다운로드 시작: {os.path.basename(remote_path)}")
         
-        if success:
-            status_wrapper(f"다운로드 완료: {local_path}")
+        # 파일 전송 실행 (작은 파일은 진행률 파싱 없이 받고 완료 시 한 번만 보고)
+        remote_size = self._remote_size(remote_path)
+        if remote_size is not None and remote_size < SMALL_FILE_THRESHOLD:
+            success = self.adb_manager.pull_file_simple(remote_path, local_path)
+            if success and progress_callback:
+                progress_callback(remote_size, remote_size, "다운로드 중...")
         else:
-            status_wrapper(f"다운로드 실패: {remote_path}")
+            success = self.adb_manager.pull_file(remote_path, local_path, progress_callback, "다운로드 중...",
+                                                 total_size=-1 if remote_size is None else remote_size)
+        
+        self.invalidate_stat(local_path)
+        if not success:
+            # 디렉토리가 그 사이 지워졌을 수 있으므로 다음 전송에서 다시 확인
+            self._known_dirs.discard(local_dir)
+        if status_callback:
+            status_callback(f"다운로드 완료: {local_path}" if success else f"다운로드 실패: {remote_path}")
         
         return success
     
@@ -51,155 +278,587 @@ class FileManager:
                    progress_callback: Optional[Callable[[int, int, str], None]] = None,
                    status_callback: Optional[Callable[[str], None]] = None) -> bool:
         """파일을 로컬에서 디바이스로 업로드"""
-        
-        def progress_wrapper(transferred: int, total: int):
-            if progress_callback:
-                progress_callback(transferred, total, "업로드 중...")
-        
-        def status_wrapper(message: str):
-            if status_callback:
-                status_callback(message)
-        
+        if progress_callback:
+            progress_callback = self._throttle(progress_callback)
         # 로컬 파일 존재 확인
-        if not os.path.exists(local_path):
-            status_wrapper(f"로컬 파일이 존재하지 않음: {local_path}")
+        try:
+            local_size = self._stat(local_path).st_size
+        except OSError:
+            if status_callback:
+                status_callback(f"로컬 파일이 존재하지 않음: {local_path}")
             return False
         
         # 원격 디렉토리 생성
         remote_dir = os.path.dirname(remote_path)
         if remote_dir:
-            self.adb_manager.create_directory(remote_dir)
-        
-        status_wrapper(f"업로드 시작: {os.path.basename(local_path)}")
+            self._make_remote_dir(remote_dir)
         
-        # 파일 전송 실행
-        success = self.adb_manager.push_file(local_path, remote_path, progress_wrapper)
+        if status_callback:
+            status_callback(f"업로드 시작: {os.path.basename(local_path)}")
         
-        if success:
-            status_wrapper(f"업로드 완료: {remote_path}")
+        # 파일 전송 실행 (작은 파일은 진행률 파싱 없이 보내고 완료 시 한 번만 보고)
+        if local_size < SMALL_FILE_THRESHOLD:
+            success = self.adb_manager.push_file_simple(local_path, remote_path)
+            if success and progress_callback:
+                progress_callback(local_size, local_size, "업로드 중...")
         else:
-            status_wrapper(f"업로드 실패: {local_path}")
+            success = self.adb_manager.push_file(local_path, remote_path, progress_callback, "업로드 중...")
+        
+        if status_callback:
+            status_callback(f"업로드 완료: {remote_path}" if success else f"업로드 실패: {local_path}")
         
         return success
     
+    async def transfer(self, direction: str, src_path: str, dst_path: str,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                       status_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """파일 하나를 `adb pull`/`adb push` 하위 프로세스로 전송 (FileManager 이벤트 루프에서 실행)
+
+        `direction`이 'download'면 (원격 → 로컬), 'upload'면 (로컬 → 원격) 경로를 받는다.
+        동시에 실행되는 전송은 `MAX_CONCURRENT_TRANSFERS`개로 제한되고, 나머지는 차례를 기다린다.
+        """
+        if direction not in ('download', 'upload'):
+            raise ValueError(f"알 수 없는 전송 방향: {direction}")
+        download = direction == 'download'
+        action = "다운로드" if download else "업로드"
+        if progress_callback:
+            progress_callback = self._throttle(progress_callback)
+
+        async with self._transfer_slots:
+            if download:
+                self._ensure_local_dir(os.path.dirname(dst_path))
+                total = await self._remote_size_async(src_path)
+            else:
+                try:
+                    total = self._stat(src_path).st_size
+                except OSError:
+                    if status_callback:
+                        status_callback(f"로컬 파일이 존재하지 않음: {src_path}")
+                    return False
+                remote_dir = os.path.dirname(dst_path)
+                if remote_dir:
+                    await self._make_remote_dir_async(remote_dir)
+
+            if status_callback:
+                status_callback(f"{action} 시작: {os.path.basename(src_path)}")
+            try:
+                success = False
+                if download and total is not None and total >= RANGED_PULL_THRESHOLD and hasattr(os, 'pwrite'):
+                    success = await self._ranged_pull(src_path, dst_path, total, progress_callback, f"{action} 중...")
+                if not success:
+                    # 작은 파일이거나 구간 받기에 실패하면 `adb pull` 한 번으로 전송
+                    success = await self._run_adb_transfer('pull' if download else 'push', src_path, dst_path,
+                                                           total, progress_callback, f"{action} 중...")
+            except asyncio.CancelledError:
+                if download:
+                    # 중단된 다운로드가 남긴 불완전한 파일 정리
+                    try:
+                        os.remove(dst_path)
+                    except OSError:
+                        pass
+                    self.invalidate_stat(dst_path)
+                raise
+            if download:
+                self.invalidate_stat(dst_path)
+                if not success:
+                    self._known_dirs.discard(os.path.dirname(dst_path))
+            if status_callback:
+                status_callback(f"{action} 완료: {dst_path}" if success else f"{action} 실패: {src_path}")
+            return success
+
+    async def _ranged_pull(self, remote_path: str, local_path: str, total: int,
+                           progress_callback: Optional[Callable[[int, int, str], None]], label: str) -> bool:
+        """큰 파일을 `RANGED_PULL_PARTS`개 구간으로 나눠 `adb exec-out dd`로 동시에 받고 각 위치에 기록
+
+        한 구간이라도 크기가 맞지 않으면 (디바이스에 `dd`가 없는 경우 등) False를 반환하며,
+        이때 호출자는 일반 `adb pull`로 다시 받는다.
+        """
+        adb_path, device = self.adb_manager.adb_path, self.adb_manager.current_device
+        if not adb_path or not device:
+            return False
+
+        block = _COPY_CHUNK
+        blocks = -(-total // block)
+        per_part = -(-blocks // RANGED_PULL_PARTS)
+        quoted = shlex.quote(remote_path)
+        received_total = [0]
+
+        async def pull_part(fd: int, skip: int) -> bool:
+            offset = skip * block
+            expected = min(per_part * block, total - offset)
+            process = await asyncio.create_subprocess_exec(
+                adb_path, '-s', device, 'exec-out',
+                f"dd if={quoted} bs={block} skip={skip} count={per_part} 2>/dev/null",
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            received = 0
+            try:
+                while chunk := await process.stdout.read(block):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset + received)
+                        view = view[written:]
+                        received += written
+                    received_total[0] += len(chunk)
+                    if progress_callback:
+                        progress_callback(received_total[0], total, label)
+                await process.wait()
+            except BaseException:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                raise
+            return received == expected
+
+        try:
+            fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        except OSError as e:
+            print(f"파일 다운로드 실패: {e}")
+            return False
+        try:
+            # 구간들이 제자리에 쓰일 수 있도록 전체 크기를 미리 확보
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, total)
+                except OSError:
+                    os.ftruncate(fd, total)
+            else:
+                os.ftruncate(fd, total)
+            parts = [asyncio.ensure_future(pull_part(fd, skip)) for skip in range(0, blocks, per_part)]
+            try:
+                success = all(await asyncio.gather(*parts))
+            except BaseException:
+                # 한 구간이 실패하거나 취소되면 나머지 구간을 멈추고, 모두 끝난 뒤에야 fd를 닫음
+                for part in parts:
+                    part.cancel()
+                await asyncio.gather(*parts, return_exceptions=True)
+                raise
+        except OSError as e:
+            print(f"구간 다운로드 실패: {e}")
+            success = False
+        finally:
+            os.close(fd)
+        if not success:
+            # 불완전한 파일은 남기지 않음
+            try:
+                os.remove(local_path)
+            except OSError:
+                pass
+        return success
+
+    async def _run_adb_transfer(self, command: str, src_path: str, dst_path: str, total: Optional[int],
+                                progress_callback: Optional[Callable[[int, int, str], None]], label: str) -> bool:
+        """`adb pull/push` 프로세스를 실행하고 출력에서 진행률을 읽음 (작은 파일은 진행률 없이 실행)"""
+        adb_path, device = self.adb_manager.adb_path, self.adb_manager.current_device
+        if not adb_path or not device:
+            return False
+
+        track = progress_callback is not None and not (total is not None and total < SMALL_FILE_THRESHOLD)
+        args = [adb_path, '-s', device, command, *(('-p',) if track else ()), src_path, dst_path]
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        except OSError as e:
+            print(f"파일 전송 실패 ({command}): {e}")
+            return False
+
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            while chunk := await process.stdout.read(1 << 16):
+                if track and (matches := _PERCENT_PATTERN.findall(chunk)):
+                    percentage = int(matches[-1])
+                    if total:
+                        progress_callback(total * percentage // 100, total, label)
+                    else:
+                        progress_callback(percentage, 100, label)
+            stderr = await stderr_task
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            # 취소되면 adb 프로세스에 종료를 요청하고, 유예 시간 안에 끝나지 않으면 강제 종료
+            stderr_task.cancel()
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), CANCEL_GRACE_PERIOD)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+            raise
+
+        if returncode != 0:
+            print(f"파일 전송 실패 ({command}): {stderr.decode('utf-8', errors='replace')}")
+            return False
+        if progress_callback and total is not None:
+            progress_callback(total, total, label)
+        return True
+
+    def _submit_transfer(self, transfer_type: str, remote_path: str, local_path: str,
+                         coro, completion_callback: Optional[Callable[[bool], None]]) -> TransferHandle:
+        """전송 코루틴을 FileManager 이벤트 루프에 예약하고 전송 ID를 반환"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        transfer_id = TransferHandle(next(self._handles))
+        with self._lock:
+            self.transfer_threads[transfer_id] = {
+                'type': transfer_type,
+                'remote_path': remote_path,
+                'local_path': local_path,
+                'future': future
+            }
+            self._active[transfer_id] = TransferInfo(transfer_id, transfer_type, remote_path, local_path)
+            self._active_snapshot = None
+
+        def on_done(f: Future):
+            # 전송 완료(또는 취소) 후 항목 제거
+            with self._lock:
+                if self._active.pop(transfer_id, None) is not None:
+                    self._active_snapshot = None
+                self.transfer_threads.pop(transfer_id, None)
+                self.transfer_status.pop(transfer_id, None)
+            if completion_callback:
+                self._events.put((completion_callback, (not f.cancelled() and f.exception() is None and bool(f.result()),)))
+
+        future.add_done_callback(on_done)
+        return transfer_id
+
     def download_file_async(self, remote_path: str, local_path: str,
                            progress_callback: Optional[Callable[[int, int, str], None]] = None,
                            status_callback: Optional[Callable[[str], None]] = None,
-                           completion_callback: Optional[Callable[[bool], None]] = None) -> str:
+                           completion_callback: Optional[Callable[[bool], None]] = None) -> TransferHandle:
         """비동기 파일 다운로드"""
-        
-        def download_worker():
-            success = self.download_file(remote_path, local_path, progress_callback, status_callback)
-            if completion_callback:
-                completion_callback(success)
-            # 전송 완료 후 스레드 ID 제거
-            thread_id = threading.current_thread().ident
-            if thread_id in self.transfer_threads:
-                del self.transfer_threads[thread_id]
-        
-        thread = threading.Thread(target=download_worker, daemon=True)
-        thread.start()
-        
-        self.transfer_threads[thread.ident] = {
-            'type': 'download',
-            'remote_path': remote_path,
-            'local_path': local_path,
-            'thread': thread
-        }
-        
-        return str(thread.ident)
+        return self._submit_transfer(
+            'download', remote_path, local_path,
+            self.transfer('download', remote_path, local_path,
+                          self._deferred(progress_callback), self._deferred(status_callback)),
+            completion_callback
+        )
     
     def upload_file_async(self, local_path: str, remote_path: str,
                          progress_callback: Optional[Callable[[int, int, str], None]] = None,
                          status_callback: Optional[Callable[[str], None]] = None,
-                         completion_callback: Optional[Callable[[bool], None]] = None) -> str:
+                         completion_callback: Optional[Callable[[bool], None]] = None) -> TransferHandle:
         """비동기 파일 업로드"""
-        
-        def upload_worker():
-            success = self.upload_file(local_path, remote_path, progress_callback, status_callback)
-            if completion_callback:
-                completion_callback(success)
-            # 전송 완료 후 스레드 ID 제거
-            thread_id = threading.current_thread().ident
-            if thread_id in self.transfer_threads:
-                del self.transfer_threads[thread_id]
-        
-        thread = threading.Thread(target=upload_worker, daemon=True)
-        thread.start()
-        
-        self.transfer_threads[thread.ident] = {
-            'type': 'upload',
-            'remote_path': remote_path,
-            'local_path': local_path,
-            'thread': thread
-        }
-        
-        return str(thread.ident)
+        return self._submit_transfer(
+            'upload', remote_path, local_path,
+            self.transfer('upload', local_path, remote_path,
+                          self._deferred(progress_callback), self._deferred(status_callback)),
+            completion_callback
+        )
     
-    def cancel_transfer(self, thread_id: str) -> bool:
-        """파일 전송 취소"""
+    def copy_local_file(self, src_path: str, dst_path: str,
+                        progress_callback: Optional[Callable[[int, int, str], None]] = None) -> bool:
+        """로컬 파일을 다른 로컬 경로로 복사"""
         try:
-            thread_id_int = int(thread_id)
-            if thread_id_int in self.transfer_threads:
-                # 스레드는 강제 종료할 수 없으므로 상태만 업데이트
-                self.transfer_status[thread_id] = 'cancelled'
-                return True
-        except ValueError:
-            pass
-        return False
+            self._ensure_local_dir(os.path.dirname(dst_path))
+            with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                nbytes = os.fstat(src.fileno()).st_size
+                progress = None
+                if progress_callback:
+                    progress = lambda done, total: progress_callback(done, total, "복사 중...")
+                copied = self._local_copy(src.fileno(), dst.fileno(), nbytes, progress)
+            return copied == nbytes
+        except OSError as e:
+            print(f"로컬 파일 복사 실패: {e}")
+            return False
+        finally:
+            self.invalidate_stat(dst_path)
+
+    @staticmethod
+    def _local_copy(src_fd: int, dst_fd: int, nbytes: int,
+                    progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """파일 디스크립터 간 `nbytes` 복사 후 복사한 바이트 수를 반환
+
+        Linux에서는 `os.sendfile`로 커널 안에서 복사하고, 그 외 환경이나 sendfile이
+        지원되지 않는 파일 시스템에서는 1MB 단위 읽기/쓰기로 대체한다. 진행률은 1MB마다 보고한다.
+        """
+        offset = 0
+        if sys.platform.startswith('linux'):
+            try:
+                while offset < nbytes:
+                    sent = os.sendfile(dst_fd, src_fd, offset, min(_COPY_CHUNK, nbytes - offset))
+                    if sent == 0:
+                        break
+                    offset += sent
+                    if progress:
+                        progress(offset, nbytes)
+                return offset
+            except OSError:
+                # 복사한 위치부터 일반 읽기/쓰기로 이어서 진행
+                os.lseek(src_fd, offset, os.SEEK_SET)
+
+        with open(src_fd, 'rb', closefd=False) as src, open(dst_fd, 'wb', closefd=False) as dst:
+            while offset < nbytes and (chunk := src.read(min(_COPY_CHUNK, nbytes - offset))):
+                dst.write(chunk)
+                offset += len(chunk)
+                if progress:
+                    progress(offset, nbytes)
+        return offset
+
+    @contextmanager
+    def open_remote(self, remote_path: str) -> Iterator[IO[bytes]]:
+        """원격 파일을 `adb exec-out cat` 출력 스트림으로 열기
+
+        디스크에 먼저 저장하지 않으므로 미리보기/해시 계산 등은 데이터가 도착하는 대로
+        처리를 시작할 수 있다. 파일이 필요하면 `shutil.copyfileobj`로 옮기면 된다.
+        스트림을 끝까지 읽고 블록을 빠져나왔는데 프로세스가 0이 아닌 코드로 끝나면 `OSError`를 발생시킨다.
+        일부만 읽고 나온 경우에는 남은 전송을 버리며 종료 코드는 확인하지 않는다.
+        """
+        process = self.adb_manager.popen(['exec-out', f"cat {shlex.quote(remote_path)}"],
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=_COPY_CHUNK)
+        if process is None:
+            raise OSError("현재 디바이스가 설정되지 않음")
+
+        reached_eof = False
+        try:
+            yield process.stdout
+            reached_eof = not process.stdout.closed and not process.stdout.peek(1)
+        finally:
+            if not reached_eof:
+                # 읽기를 중단했거나 일부만 읽은 경우 남은 전송은 버림 (SIGPIPE/강제 종료는 실패가 아님)
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+        if reached_eof and returncode != 0:
+            raise OSError(f"원격 파일 읽기 실패 (종료 코드 {returncode}): {remote_path}")
+
+    def transfer_batch(self, pairs: List[Tuple[str, str]], direction: str,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                       status_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """여러 파일을 원격 디렉토리별 `tar` 스트림 하나로 묶어 전송
+
+        `pairs`는 다운로드면 (원격 경로, 로컬 경로), 업로드면 (로컬 경로, 원격 경로) 목록이다.
+        파일마다 adb 프로세스를 띄우는 대신 원격 디렉토리마다 한 번만 띄우며,
+        tar 전송에 실패한 파일은 `download_file`/`upload_file`로 하나씩 다시 시도한다.
+        """
+        if direction not in ('download', 'upload'):
+            raise ValueError(f"알 수 없는 전송 방향: {direction}")
+        if len(pairs) <= 1:
+            single = self.download_file if direction == 'download' else self.upload_file
+            return all(single(src, dst, progress_callback, status_callback) for src, dst in pairs)
+
+        # 원격 상위 디렉토리별로 묶어서 `tar -C <디렉토리>` 한 번으로 처리
+        groups = defaultdict(dict)
+        for src, dst in pairs:
+            remote_path = src if direction == 'download' else dst
+            groups[posixpath.dirname(remote_path) or '/'][posixpath.basename(remote_path)] = (src, dst)
+
+        if direction == 'download':
+            total = self._remote_total_size([src for src, _ in pairs])
+        else:
+            total = sum(os.path.getsize(src) for src, _ in pairs if os.path.isfile(src))
+        progress = [0, total]
+        label = "다운로드 중..." if direction == 'download' else "업로드 중..."
+        report = self._throttle(progress_callback) if progress_callback else None
+
+        def advance(nbytes: int):
+            progress[0] += nbytes
+            if report:
+                report(progress[0], progress[1], label)
+
+        success = True
+        for remote_dir, members in groups.items():
+            if status_callback:
+                status_callback(f"일괄 전송 시작: {remote_dir} ({len(members)}개)")
+            if direction == 'download':
+                leftovers = self._tar_download(remote_dir, members, advance)
+            else:
+                leftovers = self._tar_upload(remote_dir, members, advance)
+            # tar를 쓸 수 없거나 실패한 파일은 단일 파일 경로로 대체
+            single = self.download_file if direction == 'download' else self.upload_file
+            for src, dst in leftovers:
+                success = single(src, dst, progress_callback, status_callback) and success
+
+        if status_callback:
+            status_callback(f"일괄 전송 {'완료' if success else '실패'}: {len(pairs)}개 파일")
+        return success
+
+    def _remote_total_size(self, remote_paths: List[str]) -> int:
+        """원격 파일 크기의 합 (`stat` 한 번으로 조회, 실패 시 -1)"""
+        status, output = self._shell_run("stat -c %s " + " ".join(shlex.quote(p) for p in remote_paths))
+        sizes = output.split()
+        if status != 0 or len(sizes) != len(remote_paths) or not all(size.isdigit() for size in sizes):
+            return -1
+        return sum(int(size) for size in sizes)
+
+    def _tar_download(self, remote_dir: str, members: Dict[str, Tuple[str, str]],
+                      advance: Callable[[int], None]) -> List[Tuple[str, str]]:
+        """`adb exec-out tar -cf -` 출력을 풀어 로컬 경로에 기록하고, 받지 못한 (원격, 로컬) 쌍을 반환"""
+        command = f"tar -C {shlex.quote(remote_dir)} -cf - " + " ".join(shlex.quote(name) for name in members)
+        process = self.adb_manager.popen(['exec-out', command], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if process is None:
+            return list(members.values())
+
+        pending = dict(members)
+        buffer = memoryview(bytearray(_COPY_CHUNK))
+        try:
+            with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+                for member in tar:
+                    entry = pending.get(member.name) if member.isfile() else None
+                    if entry is None:
+                        continue
+                    local_path = entry[1]
+                    self._ensure_local_dir(os.path.dirname(local_path))
+                    try:
+                        self._write_stream(tar.extractfile(member), local_path, member.size, buffer, advance)
+                    finally:
+                        self.invalidate_stat(local_path)
+                    del pending[member.name]
+        except (tarfile.TarError, OSError) as e:
+            print(f"일괄 다운로드 실패: {e}")
+        finally:
+            process.stdout.close()
+            process.wait()
+        return list(pending.values())
+
+    @staticmethod
+    def _write_stream(source: IO[bytes], local_path: str, size: int, buffer: memoryview,
+                      advance: Callable[[int], None]):
+        """스트림을 로컬 파일에 기록
+
+        호출자가 준 버퍼 하나를 `readinto`로 재사용하므로 조각마다 bytes 객체를 새로 만들지 않고,
+        크기를 아는 파일은 미리 공간을 할당해 큰 파일 쓰기 중의 블록 할당 작업을 줄인다.
+        """
+        with open(local_path, 'wb', buffering=0) as f:
+            if size > _COPY_CHUNK and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, size)
+                except OSError:
+                    pass
+            while n := source.readinto(buffer):
+                chunk = buffer[:n]
+                while chunk:
+                    chunk = chunk[f.write(chunk):]
+                advance(n)
+
+    def _tar_upload(self, remote_dir: str, members: Dict[str, Tuple[str, str]],
+                    advance: Callable[[int], None]) -> List[Tuple[str, str]]:
+        """로컬 파일을 tar 스트림으로 묶어 원격 `tar -xf -`에 전달하고, 실패 시 (로컬, 원격) 쌍 전체를 반환"""
+        self._make_remote_dir(remote_dir)
+        process = self.adb_manager.popen(['shell', f"tar -C {shlex.quote(remote_dir)} -xf -"],
+                                         stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if process is None:
+            return list(members.values())
+
+        failed = False
+        try:
+            with tarfile.open(fileobj=process.stdin, mode='w|') as tar:
+                for name, (local_path, _) in members.items():
+                    tar.add(local_path, arcname=name, recursive=False)
+                    advance(os.path.getsize(local_path))
+            process.stdin.close()
+        except OSError as e:
+            # 로컬 파일을 읽지 못했거나 원격 tar가 없어 파이프가 먼저 닫힘
+            # (중간에 끊긴 스트림도 원격 tar는 성공으로 끝낼 수 있으므로 종료 코드와 무관하게 실패로 처리)
+            print(f"일괄 업로드 실패: {e}")
+            failed = True
+        finally:
+            if not process.stdin.closed:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            returncode = process.wait()
+        return [] if returncode == 0 and not failed else list(members.values())
+
+    def cancel_transfer(self, handle: TransferHandle) -> bool:
+        """파일 전송 취소"""
+        with self._lock:
+            info = self.transfer_threads.get(handle)
+            if info is None:
+                return False
+            self.transfer_status[handle] = 'cancelled'
+        # 예약된 전송 작업을 취소 (실행 중이면 adb 프로세스도 함께 종료됨)
+        info['future'].cancel()
+        return True
     
-    def get_transfer_status(self, thread_id: str) -> Dict[str, Any]:
+    def get_transfer_status(self, handle: TransferHandle) -> Dict[str, Any]:
         """파일 전송 상태 조회"""
-        try:
-            thread_id_int = int(thread_id)
-            if thread_id_int in self.transfer_threads:
-                thread_info = self.transfer_threads[thread_id_int]
-                return {
-                    'type': thread_info['type'],
-                    'remote_path': thread_info['remote_path'],
-                    'local_path': thread_info['local_path'],
-                    'is_alive': thread_info['thread'].is_alive(),
-                    'status': self.transfer_status.get(thread_id, 'running')
-                }
-        except ValueError:
-            pass
-        return {}
+        with self._lock:
+            thread_info = self.transfer_threads.get(handle)
+            status = self.transfer_status.get(handle, 'running')
+        if thread_info is None:
+            return {}
+        return {
+            'type': thread_info['type'],
+            'remote_path': thread_info['remote_path'],
+            'local_path': thread_info['local_path'],
+            'is_alive': not thread_info['future'].done(),
+            'status': status
+        }
     
-    def get_active_transfers(self) -> List[Dict[str, Any]]:
-        """활성 전송 목록 조회"""
-        active_transfers = []
-        for thread_id, info in self.transfer_threads.items():
-            if info['thread'].is_alive():
-                active_transfers.append({
-                    'thread_id': str(thread_id),
-                    'type': info['type'],
-                    'remote_path': info['remote_path'],
-                    'local_path': info['local_path']
-                })
-        return active_transfers
+    def get_active_transfers(self) -> Tuple[TransferInfo, ...]:
+        """활성 전송 목록 조회
+
+        완료 콜백이 `_active`를 관리하므로 항목별 상태 확인이 필요 없고, 목록이 바뀌지 않았으면
+        같은 튜플을 그대로 돌려준다. dict가 필요하면 호출하는 쪽에서 `_asdict()`로 변환한다.
+        """
+        with self._lock:
+            if self._active_snapshot is None:
+                self._active_snapshot = tuple(self._active.values())
+            return self._active_snapshot
     
-    def format_file_size(self, size_bytes: int) -> str:
+    @staticmethod
+    def format_file_size(size_bytes: int) -> str:
         """파일 크기를 읽기 쉬운 형태로 변환"""
-        if size_bytes == 0:
-            return "0 B"
+        if 0 <= size_bytes < _SMALL_LIMIT:
+            if size_bytes < 1024:
+                return _SMALL_BYTES[size_bytes]
+            if size_bytes < 1 << 20:
+                return _SMALL_KB[_tenths(size_bytes, 10)]
+            return _SMALL_MB[_tenths(size_bytes, 20)]
         
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
+        # 1024 단위 지수는 비트 길이로 바로 구함 (나눗셈 반복 없음)
+        unit = min((size_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit * 10)):.1f} {_UNITS[unit]}"
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """파일 정보 조회"""
-        if os.path.exists(file_path):
-            stat = os.stat(file_path)
-            return {
-                'exists': True,
-                'size': stat.st_size,
-                'size_formatted': self.format_file_size(stat.st_size),
-                'modified': stat.st_mtime,
-                'is_directory': os.path.isdir(file_path)
-            }
-        return {'exists': False}
+        try:
+            st = self._stat(file_path)
+        except OSError:
+            return {'exists': False}
+        return self._info_from_stat(st)
+
+    def get_file_infos(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 파일 정보를 한 번에 조회 (상위 디렉토리마다 `os.scandir` 한 번)
+
+        결과는 호출자가 넘긴 경로를 키로 하며, 각 경로에 대해 `get_file_info`와 같은 결과를 낸다.
+        """
+        by_parent = defaultdict(lambda: defaultdict(list))
+        infos = {}
+        for path in paths:
+            # '/a/b/'처럼 끝에 구분자가 있어도 같은 항목을 찾도록 정규화해서 묶음
+            parent, name = os.path.split(os.path.normpath(path))
+            if name in ('', os.curdir, os.pardir):
+                # 루트나 '.', '..'은 상위 디렉토리 목록에 나오지 않으므로 따로 조회
+                infos[path] = self.get_file_info(path)
+            else:
+                by_parent[parent or os.curdir][name].append(path)
+
+        for parent, wanted in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        originals = wanted.get(entry.name)
+                        if originals is None:
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        for path in originals:
+                            # 끝에 구분자가 붙은 경로는 `os.stat`처럼 디렉토리일 때만 존재함
+                            if path.endswith(('/', os.sep)) and not stat.S_ISDIR(st.st_mode):
+                                continue
+                            self._remember_stat(path, st)
+                            infos[path] = self._info_from_stat(st)
+            except OSError:
+                pass
+        return {path: infos.get(path, {'exists': False}) for path in paths}
+
+    def _info_from_stat(self, st: os.stat_result) -> Dict[str, Any]:
+        return {
+            'exists': True,
+            'size': st.st_size,
+            'size_formatted': self.format_file_size(st.st_size),
+            'modified': st.st_mtime,
+            'is_directory': stat.S_ISDIR(st.st_mode)
+        }
@@ -4,8 +4,19 @@
 """
 
 import os
+import posixpath
 import re
-from typing import List, Optional, Dict, Any
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+
+
+# 파일 테이블 열별 정렬 키 (행에는 항상 이 필드가 있고 '_' 필드는 불러올 때 미리 계산되므로 itemgetter로 충분)
+SORT_KEYS = {
+    'name': itemgetter('_name_lower'),
+    'type': itemgetter('type'),
+    'size': itemgetter('_size_bytes'),
+    'date': itemgetter('date'),
+}
 
 
 def sanitize_filename(filename: str) -> str:
@@ -191,3 +202,42 @@ def get_file_category(filename: str) -> str:
         return "실행파일"
     else:
         return "기타"
+
+
+def short_name_list(rows: Iterable[Any], limit: int) -> Optional[str]:
+    """행들의 파일명을 ', '로 이어 반환 (`limit`자를 넘게 되는 즉시 None 반환)"""
+    names = []
+    length = -2  # 첫 이름 앞에는 구분자가 없음
+    for row in rows:
+        length += len(row.filename) + 2
+        if length > limit:
+            return None
+        names.append(row.filename)
+    return ", ".join(names)
+
+
+def split_paste_sources(source_paths: Iterable[str], destination_dir: str) -> Tuple[Optional[str], List[str], List[str]]:
+    """붙여넣을 원본 경로를 한 번 훑어 (자기 하위로 붙여넣는 원본, 붙여넣을 원본, 이미 대상 디렉토리에 있는 원본)으로 나눔
+
+    `destination_dir`가 자기 자신이거나 그 하위 디렉토리인 원본을 만나면 바로 멈추고
+    그 원본과 빈 목록들을 반환한다. 대상과 그 상위 디렉토리를 집합으로 만들어 두므로
+    원본마다 접두사를 비교하지 않고 대상 깊이만큼의 비용으로 확인한다.
+    """
+    dest_norm = destination_dir.rstrip('/') or '/'
+    ancestors = set()
+    cur = dest_norm
+    while cur and cur != '/':
+        ancestors.add(cur + '/')
+        cur = posixpath.dirname(cur)
+
+    pending = []
+    in_destination = []
+    for src_path in source_paths:
+        src_norm = src_path.rstrip('/')
+        if src_norm + '/' in ancestors:
+            return src_path, [], []
+        if posixpath.dirname(src_norm) == dest_norm:
+            in_destination.append(src_path)
+        else:
+            pending.append(src_path)
+    return None, pending, in_destination
@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from adbfs.adb_manager import ADBManager
+
+
+posix_only = pytest.mark.skipif(sys.platform == 'win32', reason="runs the listing command with a local sh")
+
+
+STAT_OUTPUT = "\n".join([
+    "drwxrwx--x/3488/1700000000/root/sdcard_rw//sdcard/DCIM",
+    "-rw-rw----/1048576/1700000100/u0_a1/media_rw//sdcard/my file.jpg",
+    "lrwxrwxrwx/21/1700000200/root/root//sdcard/link -> target",
+])
+
+
+def test_parse_file_list_stat_format():
+    """`stat -c` lines are split into their fields with a numeric mtime."""
+    files = ADBManager().parse_file_list(STAT_OUTPUT, "/sdcard")
+    assert [f['name'] for f in files] == ["DCIM", "my file.jpg", "link -> target"]
+
+    folder, photo, link = files
+    assert folder['is_directory'] and not folder['is_link']
+    assert folder['path'] == "/sdcard/DCIM"
+    assert photo == {
+        'name': "my file.jpg",
+        'path': "/sdcard/my file.jpg",
+        'is_directory': False,
+        'is_link': False,
+        'size': "1048576",
+        'permissions': "-rw-rw----",
+        'date': '',
+        'mtime': 1700000100,
+        'owner': "u0_a1",
+        'group': "media_rw",
+    }
+    assert link['is_link'] and not link['is_directory']
+
+
+def test_parse_file_list_stat_format_crlf_and_root():
+    """Carriage returns from older adb shells are stripped; root entries keep one slash."""
+    files = ADBManager().parse_file_list("drwxr-xr-x/4096/1700000000/root/root//sdcard\r\n", "/")
+    assert len(files) == 1
+    assert files[0]['name'] == "sdcard"
+    assert files[0]['path'] == "/sdcard"
+    assert files[0]['mtime'] == 1700000000
+
+
+def test_parse_file_list_ls_fallback():
+    """`ls -la` output is still understood and has no mtime."""
+    output = "\n".join([
+        "total 8",
+        "drwxrwx--x  2 root sdcard_rw 3488 2024-01-02 10:00 .",
+        "drwxrwx--x  2 root sdcard_rw 3488 2024-01-02 10:00 ..",
+        "-rw-rw----  1 root sdcard_rw  120 2024-01-02 10:05 notes.txt",
+    ])
+    files = ADBManager().parse_file_list(output, "/sdcard")
+    assert len(files) == 1
+    assert files[0]['name'] == "notes.txt"
+    assert files[0]['path'] == "/sdcard/notes.txt"
+    assert files[0]['size'] == "120"
+    assert files[0]['date'] == "2024-01-02 10:05"
+    assert files[0]['mtime'] is None
+
+
+def test_parse_file_list_empty():
+    """Empty output gives an empty list."""
+    assert ADBManager().parse_file_list("", "/sdcard") == []
+
+
+def _run_listing(tmp_path, path, find_script=None):
+    """Run `file_list_command` with the local `sh`, optionally in front of a stand-in `find`."""
+    env = dict(os.environ)
+    if find_script is not None:
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        find = bin_dir / "find"
+        find.write_text("#!/bin/sh\n" + find_script)
+        find.chmod(0o755)
+        env['PATH'] = f"{bin_dir}{os.pathsep}{env['PATH']}"
+    command = ADBManager().file_list_command(f"'{path}'")
+    result = subprocess.run(['sh', '-c', command], capture_output=True, text=True, env=env)
+    return result.returncode, ADBManager().parse_file_list(result.stdout, str(path))
+
+
+@posix_only
+def test_file_list_command_uses_stat_format(tmp_path):
+    """A normal directory is listed once, in `stat` format."""
+    (tmp_path / "a").write_text("x")
+    (tmp_path / "b b").mkdir()
+    status, files = _run_listing(tmp_path, tmp_path)
+    assert status == 0
+    assert sorted(f['name'] for f in files) == ["a", "b b"]
+    assert all(f['mtime'] is not None for f in files)
+
+
+@posix_only
+def test_file_list_command_partial_find_failure_is_not_duplicated(tmp_path):
+    """Entries printed before `find` fails are not listed a second time by `ls -la`."""
+    listed = tmp_path / "listed"
+    listed.mkdir()
+    (listed / "a").write_text("x")
+    status, files = _run_listing(tmp_path, listed, f"echo '-rw-r--r--/1/1700000000/root/root/{listed}/a'\nexit 1\n")
+    assert status == 0
+    assert [f['name'] for f in files] == ["a"]
+
+
+@posix_only
+def test_file_list_command_falls_back_to_ls(tmp_path):
+    """Without a working `find` the listing comes from `ls -la`."""
+    listed = tmp_path / "listed"
+    listed.mkdir()
+    (listed / "a").write_text("x")
+    status, files = _run_listing(tmp_path, listed, "exit 1\n")
+    assert status == 0
+    assert [f['name'] for f in files] == ["a"]
+    assert files[0]['mtime'] is None
+
+
+@posix_only
+def test_file_list_command_empty_and_missing(tmp_path):
+    """An empty directory lists nothing successfully; a missing one fails."""
+    (tmp_path / "empty").mkdir()
+    assert _run_listing(tmp_path, tmp_path / "empty") == (0, [])
+    status, files = _run_listing(tmp_path, tmp_path / "missing")
+    assert status != 0 and files == []
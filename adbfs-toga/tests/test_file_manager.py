@@ -0,0 +1,233 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+from adbfs.adb_manager import ADBManager
+from adbfs import file_manager as file_manager_module
+from adbfs.file_manager import FileManager
+
+
+posix_only = pytest.mark.skipif(sys.platform == 'win32', reason="fake adb is a POSIX shell script")
+
+_FAKE_ADB = '''#!/bin/sh
+shift 2
+echo "$1" >> "$(dirname "$0")/calls.log"
+cmd=$1; shift
+case $cmd in
+  shell) if [ $# -gt 0 ]; then exec sh -c "$*"; else exec sh; fi;;
+  exec-out) exec sh -c "$*";;
+  pull|push) [ "$1" = "-p" ] && shift; cp "$1" "$2";;
+esac
+'''
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    """A FileManager whose `adb` runs every device command against the local filesystem."""
+    path = tmp_path / "adb"
+    path.write_text(_FAKE_ADB)
+    path.chmod(0o755)
+    adb_manager = ADBManager()
+    adb_manager.adb_path = str(path)
+    adb_manager.current_device = "dev"
+    file_manager = FileManager(adb_manager)
+    yield file_manager
+    file_manager.shutdown()
+
+
+def _adb_calls(tmp_path):
+    log = tmp_path / "calls.log"
+    return log.read_text().split() if log.exists() else []
+
+
+def _reference_size(size_bytes):
+    """The original division loop that format_file_size must keep matching."""
+    if size_bytes == 0:
+        return "0 B"
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024 and i < len(size_names) - 1:
+        size_bytes /= 1024.0
+        i += 1
+    return f"{size_bytes:.1f} {size_names[i]}"
+
+
+def test_format_file_size_large_sizes():
+    """Sizes from 10 MB up pick their unit from the bit length."""
+    sizes = [10 << 20, (10 << 20) + 1, (1 << 30) - 1, 1 << 30, 5 * (1 << 40), 3 << 50, (1 << 64) - 1]
+    sizes += [(1 << shift) + delta for shift in range(24, 60) for delta in (-1, 0, 1)]
+    for size in sizes:
+        assert FileManager.format_file_size(size) == _reference_size(size), size
+
+
+def test_format_file_size_small_tables():
+    """Sizes under 10 MB come from the precomputed tables and match the loop exactly."""
+    # Every size below 64 KB, then both sides of each rounding boundary up to 10 MB
+    sizes = list(range(64 << 10))
+    for shift, tenths in ((10, 10240), (20, 100)):
+        for tenth in range(tenths + 1):
+            boundary = ((2 * tenth + 1) << shift) // 20
+            sizes += [boundary - 1, boundary, boundary + 1]
+    sizes += [1023, 1024, (1 << 20) - 1, 1 << 20, (10 << 20) - 1]
+    for size in sizes:
+        if 0 <= size < 10 << 20:
+            assert FileManager.format_file_size(size) == _reference_size(size), size
+
+
+def test_throttle_drops_intermediate_updates():
+    """Within one interval only the first update and the final report get through."""
+    calls = []
+    throttled = FileManager._throttle(lambda *args: calls.append(args), min_interval=3600)
+    for transferred in range(0, 101, 10):
+        throttled(transferred, 100, "label")
+    assert calls == [(0, 100, "label"), (100, 100, "label")]
+
+
+def test_throttle_passes_everything_without_interval():
+    """With no minimum interval every update is delivered in order."""
+    calls = []
+    throttled = FileManager._throttle(lambda *args: calls.append(args[0]), min_interval=0)
+    for transferred in range(5):
+        throttled(transferred, 4, "label")
+    assert calls == [0, 1, 2, 3, 4]
+
+
+@posix_only
+def test_concurrent_shell_commands_share_one_session(fake_adb, tmp_path):
+    """Commands racing to connect open a single `adb shell` session between them."""
+    async def run_all():
+        return await asyncio.gather(*(fake_adb._shell_command(f"echo {i}") for i in range(4)))
+
+    results = asyncio.run_coroutine_threadsafe(run_all(), fake_adb._ensure_loop()).result(timeout=10)
+    assert results == [(0, str(i)) for i in range(4)]
+    assert _adb_calls(tmp_path).count("shell") == 1
+
+
+@posix_only
+def test_tar_upload_falls_back_when_a_local_file_fails(fake_adb, tmp_path):
+    """A local read error mid-stream reports failure and retries every member one by one."""
+    local = tmp_path / "local"
+    local.mkdir()
+    remote = tmp_path / "remote"
+    pairs = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (local / name).write_text(name)
+        pairs.append((str(local / name), str(remote / name)))
+    pairs.append((str(local / "missing.bin"), str(remote / "missing.bin")))
+    (local / "d.txt").write_text("d.txt")
+    pairs.append((str(local / "d.txt"), str(remote / "d.txt")))
+
+    assert fake_adb.transfer_batch(pairs, 'upload') is False
+    for name in ("a.txt", "b.txt", "c.txt", "d.txt"):
+        assert (remote / name).read_text() == name
+    assert not (remote / "missing.bin").exists()
+    # Every readable member is pushed again; upload_file rejects the missing one before calling adb
+    assert _adb_calls(tmp_path).count("push") == len(pairs) - 1
+
+
+def test_get_file_infos_matches_get_file_info(tmp_path):
+    """The batch lookup agrees with the single lookup for every kind of path, keyed by the caller's path."""
+    (tmp_path / "file.txt").write_text("hello")
+    (tmp_path / "dir").mkdir()
+    paths = [
+        str(tmp_path / "file.txt"),
+        str(tmp_path / "file.txt") + "/",
+        str(tmp_path / "dir"),
+        str(tmp_path / "dir") + "/",
+        str(tmp_path / "dir" / ".." / "file.txt"),
+        str(tmp_path / "missing"),
+        str(tmp_path),
+        str(tmp_path) + "/",
+        "/",
+        ".",
+    ]
+    if sys.platform != 'win32':
+        (tmp_path / "link").symlink_to(tmp_path / "dir")
+        paths += [str(tmp_path / "link"), str(tmp_path / "link") + "/"]
+
+    infos = FileManager(ADBManager()).get_file_infos(paths)
+    assert list(infos) == paths
+    for path in paths:
+        assert infos[path] == FileManager(ADBManager()).get_file_info(path), path
+    assert infos[str(tmp_path / "dir") + "/"]['is_directory']
+    assert infos[str(tmp_path / "file.txt")]['size'] == 5
+    assert infos[str(tmp_path / "missing")] == {'exists': False}
+
+
+def test_stat_cache_invalidation_and_expiry(tmp_path, monkeypatch):
+    """Cached stats are served until invalidated or until they outlive STAT_CACHE_TTL."""
+    path = tmp_path / "f"
+    path.write_text("a")
+    manager = FileManager(ADBManager())
+    monkeypatch.setattr(file_manager_module, 'STAT_CACHE_TTL', 3600)
+    assert manager._stat(str(path)).st_size == 1
+
+    path.write_text("abc")
+    assert manager._stat(str(path)).st_size == 1  # Still cached
+    manager.invalidate_stat(str(path))
+    assert manager._stat(str(path)).st_size == 3
+
+    path.write_text("abcde")
+    manager.invalidate_stat()
+    assert manager._stat(str(path)).st_size == 5
+
+    path.write_text("abcdefg")
+    monkeypatch.setattr(file_manager_module, 'STAT_CACHE_TTL', 0)
+    assert manager._stat(str(path)).st_size == 7  # Expired entries are read again
+
+
+def test_stat_cache_does_not_cache_missing_files(tmp_path):
+    """A missing file raises each time and is found once it appears."""
+    path = tmp_path / "later"
+    manager = FileManager(ADBManager())
+    with pytest.raises(OSError):
+        manager._stat(str(path))
+    path.write_text("x")
+    assert manager._stat(str(path)).st_size == 1
+
+
+def _copy(tmp_path, data, nbytes):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(data)
+    reports = []
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        copied = FileManager._local_copy(s.fileno(), d.fileno(), nbytes, lambda done, total: reports.append((done, total)))
+    return copied, dst.read_bytes(), reports
+
+
+def test_local_copy(tmp_path):
+    """Whole files are copied with a progress report per chunk ending at the total."""
+    data = os.urandom((5 << 20) // 2)
+    copied, written, reports = _copy(tmp_path, data, len(data))
+    assert copied == len(data)
+    assert written == data
+    assert reports[-1] == (len(data), len(data))
+    assert len(reports) == 3
+
+
+def test_local_copy_partial_and_short_source(tmp_path):
+    """Only `nbytes` are copied, and a source shorter than `nbytes` stops at its end."""
+    data = b"0123456789"
+    assert _copy(tmp_path, data, 4)[:2] == (4, b"0123")
+    assert _copy(tmp_path, data, 100)[:2] == (10, data)
+
+
+def test_local_copy_without_sendfile(tmp_path, monkeypatch):
+    """When sendfile fails the copy continues with plain reads and writes."""
+    real_sendfile = getattr(os, 'sendfile', None)
+    calls = []
+
+    def flaky_sendfile(out_fd, in_fd, offset, count):
+        calls.append(offset)
+        if len(calls) > 1 or real_sendfile is None:
+            raise OSError("sendfile not supported")
+        return real_sendfile(out_fd, in_fd, offset, count)
+
+    monkeypatch.setattr(os, 'sendfile', flaky_sendfile, raising=False)
+    data = os.urandom(3 << 20)
+    copied, written, reports = _copy(tmp_path, data, len(data))
+    assert copied == len(data)
+    assert written == data
+    assert reports[-1] == (len(data), len(data))
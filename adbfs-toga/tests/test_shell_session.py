@@ -0,0 +1,64 @@
+import asyncio
+import sys
+
+import pytest
+
+from adbfs.adb_manager import ADBShellSession
+
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="fake adb is a POSIX shell script")
+
+
+def _fake_adb(tmp_path):
+    """An `adb` stand-in whose `adb -s <device> shell` is a local `sh`."""
+    path = tmp_path / "adb"
+    path.write_text("#!/bin/sh\nshift 3\nexec sh\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_shell_session_framing_and_status(tmp_path):
+    """Output and exit status come back per command, including blank and multi-line output."""
+    async def scenario():
+        async with ADBShellSession(_fake_adb(tmp_path), "dev") as session:
+            assert await session.run("echo hello") == (0, "hello")
+            assert await session.run("printf 'a\\n\\nb\\n'") == (0, "a\n\nb")
+            assert await session.run("printf 'no newline'") == (0, "no newline")
+            assert await session.run("false") == (1, "")
+            assert await session.run("sh -c 'echo out; exit 3'") == (3, "out")
+            assert await session.run("true") == (0, "")
+
+    asyncio.run(scenario())
+
+
+def test_shell_session_cancel_drops_session(tmp_path):
+    """A cancelled command closes the session instead of leaking its output into the next one."""
+    async def scenario():
+        session = ADBShellSession(_fake_adb(tmp_path), "dev")
+        await session.open()
+        task = asyncio.ensure_future(session.run("sleep 0.5; echo FIRST"))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not session.is_open
+        with pytest.raises(ConnectionError):
+            await session.run("echo SECOND")
+
+        await session.open()
+        assert await session.run("echo THIRD") == (0, "THIRD")
+        await session.close()
+
+    asyncio.run(scenario())
+
+
+def test_shell_session_timeout_drops_session(tmp_path):
+    """A command that outlives its timeout closes the session."""
+    async def scenario():
+        session = ADBShellSession(_fake_adb(tmp_path), "dev")
+        await session.open()
+        with pytest.raises(asyncio.TimeoutError):
+            await session.run("sleep 1", timeout=0.1)
+        assert not session.is_open
+
+    asyncio.run(scenario())
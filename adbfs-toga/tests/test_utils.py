@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+from adbfs.utils import SORT_KEYS, split_paste_sources, short_name_list
+
+
+def _rows(*names):
+    return [SimpleNamespace(filename=name) for name in names]
+
+
+def test_short_name_list_joins_names():
+    """Names that fit are joined with ', '."""
+    assert short_name_list(_rows("a.txt", "b.txt"), 100) == "a.txt, b.txt"
+
+
+def test_short_name_list_exact_limit():
+    """A list exactly `limit` characters long still fits."""
+    assert short_name_list(_rows("abc", "de"), len("abc, de")) == "abc, de"
+    assert short_name_list(_rows("abc", "de"), len("abc, de") - 1) is None
+
+
+def test_short_name_list_single_name_has_no_separator():
+    """The first name is not charged for a separator."""
+    assert short_name_list(_rows("abcd"), 4) == "abcd"
+    assert short_name_list(_rows("abcd"), 3) is None
+
+
+def test_short_name_list_empty():
+    """No rows give an empty string rather than None."""
+    assert short_name_list([], 0) == ""
+
+
+def test_short_name_list_stops_consuming_rows():
+    """Rows after the limit is crossed are never pulled from the iterable."""
+    seen = []
+
+    def rows():
+        for name in ("aaaa", "bbbb", "cccc"):
+            seen.append(name)
+            yield SimpleNamespace(filename=name)
+
+    assert short_name_list(rows(), 5) is None
+    assert seen == ["aaaa", "bbbb"]
+
+
+def _row(name, type_="File", size=0, date=""):
+    return {
+        'name': name,
+        'type': type_,
+        'date': date,
+        '_size_bytes': size,
+        '_name_lower': name.lower(),
+    }
+
+
+def test_sort_keys_name_is_case_insensitive():
+    """Names sort without regard to case."""
+    rows = [_row("b.txt"), _row("A.txt"), _row("c.txt")]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['name'])] == ["A.txt", "b.txt", "c.txt"]
+
+
+def test_sort_keys_size_is_numeric():
+    """Sizes sort by byte count, not by their text."""
+    rows = [_row("a", size=10), _row("b", size=9), _row("c", size=100)]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['size'])] == ["b", "a", "c"]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['size'], reverse=True)] == ["c", "a", "b"]
+
+
+def test_sort_keys_type_and_date():
+    """Type and date columns sort by their displayed values."""
+    rows = [_row("a", "Link", date="2024-01-02 10:00"),
+            _row("b", "File", date="2023-12-31 23:59"),
+            _row("c", "Folder", date="2024-01-02 09:00")]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['type'])] == ["b", "c", "a"]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['date'])] == ["b", "c", "a"]
+
+
+def test_sort_keys_are_stable():
+    """Rows with equal keys keep their load order."""
+    rows = [_row("x", size=1), _row("y", size=0), _row("z", size=1)]
+    assert [r['name'] for r in sorted(rows, key=SORT_KEYS['size'])] == ["y", "x", "z"]
+
+
+def test_split_paste_sources_rejects_own_subtree():
+    """Pasting a folder into itself or any folder below it is caught."""
+    assert split_paste_sources(["/sdcard/a"], "/sdcard/a") == ("/sdcard/a", [], [])
+    assert split_paste_sources(["/sdcard/a"], "/sdcard/a/b/c") == ("/sdcard/a", [], [])
+    assert split_paste_sources(["/sdcard/x", "/sdcard/a/"], "/sdcard/a/b/") == ("/sdcard/a/", [], [])
+
+
+def test_split_paste_sources_allows_siblings_and_parents():
+    """Prefix look-alikes, parents and unrelated folders are pasted."""
+    assert split_paste_sources(["/sdcard/a"], "/sdcard/ab") == (None, ["/sdcard/a"], [])
+    assert split_paste_sources(["/sdcard/a/b"], "/") == (None, ["/sdcard/a/b"], [])
+    assert split_paste_sources([], "/sdcard") == (None, [], [])
+
+
+def test_split_paste_sources_sets_aside_items_already_in_destination():
+    """Items whose parent is the destination are returned separately, in order."""
+    sources = ["/sdcard/a/x.txt", "/sdcard/b/y.txt", "/sdcard/a/sub/", "/z.txt"]
+    assert split_paste_sources(sources, "/sdcard/a/") == (
+        None, ["/sdcard/b/y.txt", "/z.txt"], ["/sdcard/a/x.txt", "/sdcard/a/sub/"])
+    assert split_paste_sources(sources, "/") == (
+        None, ["/sdcard/a/x.txt", "/sdcard/b/y.txt", "/sdcard/a/sub/"], ["/z.txt"])